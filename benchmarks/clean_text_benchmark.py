@@ -0,0 +1,65 @@
+"""
+Microbenchmark of text cleaning used by TextProcessingPipeline
+"""
+
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pipeline import clean_text  # pylint: disable=wrong-import-position
+
+SAMPLE = ('Красивая - мама красиво, мыла раму во второй реке. '
+          'В 2022 году (по данным «НН.РУ») ёлки стоили 1500 руб.! ')
+
+
+def legacy_clean_text(raw_text: str) -> str:
+    """
+    Character-by-character cleaning that was used before clean_text
+    """
+    pattern = re.compile(r'[а-яА-Яa-zA-z ёЁ]')
+    cleaned_text = raw_text
+    for letter in raw_text:
+        if not pattern.match(letter):
+            cleaned_text = raw_text.replace(letter, ' ')
+    return cleaned_text
+
+
+def make_text(size: int) -> str:
+    """
+    Builds a pseudo-random text of a given length
+    """
+    words = SAMPLE.split(' ')
+    random.seed(size)
+    text = ' '.join(random.choice(words) for _ in range(size // 5))
+    return text[:size]
+
+
+def measure(function, text: str) -> float:
+    """
+    Returns the best time of several runs in seconds
+    """
+    return min(timeit.repeat(lambda: function(text), number=1, repeat=3))
+
+
+def main():
+    print('clean_text on multi-megabyte articles')
+    for megabytes in (1, 2, 4, 8, 16):
+        text = make_text(megabytes * 2 ** 20)
+        seconds = measure(clean_text, text)
+        print(f'{megabytes:>3} MB: {seconds * 1000:8.1f} ms, '
+              f'{seconds / len(text) * 1e9:5.1f} ns per char')
+
+    print('legacy cleaning loop on small articles')
+    for kilobytes in (8, 16, 32, 64):
+        text = make_text(kilobytes * 2 ** 10)
+        seconds = measure(legacy_clean_text, text)
+        print(f'{kilobytes:>3} KB: {seconds * 1000:8.1f} ms, '
+              f'{seconds / len(text) * 1e9:7.1f} ns per char')
+
+
+if __name__ == '__main__':
+    main()
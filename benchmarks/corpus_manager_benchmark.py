@@ -0,0 +1,69 @@
+"""
+Benchmark of CorpusManager startup with and without the dataset index
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+# pylint: disable=wrong-import-position
+from core_utils.article import Article
+from core_utils.dataset_index import DatasetIndex
+from pipeline import CorpusManager
+
+NUMBER_OF_ARTICLES = 20000
+
+
+def make_dataset(assets_path: Path):
+    """
+    Writes raw texts and meta files of NUMBER_OF_ARTICLES articles through Article
+    """
+    DatasetIndex(assets_path).reset()
+    with mock.patch('core_utils.article.ASSETS_PATH', assets_path):
+        for article_id in range(1, NUMBER_OF_ARTICLES + 1):
+            article = Article(f'https://www.nn.ru/text/{article_id}/', article_id)
+            article.set_meta({'title': f'Статья {article_id}', 'date': '2022-04-28 18:01:00',
+                              'author': 'NOT FOUND', 'topics': ['Город']})
+            article.text = 'Текст статьи. ' * 100
+            article.save_raw()
+
+
+def load_eagerly(assets_path: Path):
+    """
+    Globs raw texts and parses every meta file as Article used to do on creation
+    """
+    with mock.patch('core_utils.article.ASSETS_PATH', assets_path):
+        for file in assets_path.glob('*_raw.txt'):
+            article = Article(None, int(file.stem.split('_')[0]))
+            meta_file = article.get_meta_file_path()
+            if meta_file.exists():
+                article.from_meta_json(meta_file)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        assets_path = Path(directory) / 'articles'
+        assets_path.mkdir()
+        make_dataset(assets_path)
+        index = DatasetIndex(assets_path)
+        print(f'{NUMBER_OF_ARTICLES} articles')
+
+        def measure(function):
+            return min(timeit.repeat(function, number=1, repeat=3))
+
+        print(f'glob and eager meta parsing: {measure(lambda: load_eagerly(assets_path)):.3f} s')
+        index.rebuild()
+        print(f'up-to-date index:            {measure(lambda: CorpusManager(assets_path)):.3f} s')
+        with mock.patch('core_utils.article.ASSETS_PATH', assets_path):
+            print(f'index and bulk metadata:     '
+                  f'{measure(lambda: CorpusManager(assets_path).load_meta()):.3f} s')
+        index.path.unlink()
+        print(f'scan without index:          {measure(lambda: CorpusManager(assets_path)):.3f} s')
+
+
+if __name__ == '__main__':
+    main()
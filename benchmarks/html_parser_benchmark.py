@@ -0,0 +1,61 @@
+"""
+Benchmark of full and fast HTMLParser modes on saved article pages
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+# pylint: disable=wrong-import-position
+from constants import HTTP_CACHE_PATH, PROJECT_ROOT
+from scrapper import HTMLParser
+
+FIXTURE_PATH = PROJECT_ROOT / 'config' / 'test_files' / 'article_page.html'
+
+
+def load_pages() -> list:
+    """
+    Returns article pages saved by the scrapper response cache
+    or the test page inflated to the size of a real nn.ru page
+    """
+    pages = [path.read_text(encoding='utf-8') for path in sorted(HTTP_CACHE_PATH.glob('*.html'))]
+    pages = [page for page in pages if '_25BQZ' in page]
+    if pages:
+        return pages
+    page = FIXTURE_PATH.read_text(encoding='utf-8')
+    aside_start, aside_end = page.index('<aside'), page.index('</aside>')
+    padding = page[aside_start:aside_end] * 150
+    return [page[:aside_end] + padding + page[aside_end:]]
+
+
+def parse(page: str, fast: bool) -> dict:
+    """
+    Parses a page and returns the article fields
+    """
+    parser = HTMLParser('https://www.nn.ru/text/', 1, client=object(), fast=fast)
+    parser.parse_html(page)
+    return parser.get_fields()
+
+
+def main():
+    pages = load_pages()
+    size = sum(len(page) for page in pages) / len(pages) / 2 ** 10
+    print(f'{len(pages)} pages, {size:.0f} KB on average')
+
+    mismatches = sum(parse(page, fast=True) != parse(page, fast=False) for page in pages)
+    print(f'pages parsed differently: {mismatches}')
+
+    results = {}
+    for fast in (False, True):
+        seconds = min(timeit.repeat(lambda: [parse(page, fast) for page in pages],  # pylint: disable=cell-var-from-loop
+                                    number=1, repeat=3))
+        results[fast] = seconds
+        mode = 'fast' if fast else 'full'
+        print(f'{mode}: {seconds / len(pages) * 1000:7.2f} ms per page')
+    print(f'speedup: {results[False] / results[True]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Memory benchmark of token storage used by TextProcessingPipeline
+"""
+
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+# pylint: disable=wrong-import-position
+from pipeline import MorphologicalTokens, TokenVocabulary
+
+ANALYSES = [
+    ('Красивая', 'красивый', 'A=им,ед,полн,жен', 'ADJF,Qual femn,sing,nomn'),
+    ('мама', 'мама', 'S,жен,од=им,ед', 'NOUN,anim,femn sing,nomn'),
+    ('мыла', 'мыть', 'V,несов,пе=прош,ед,изъяв,жен', 'VERB,impf,tran femn,sing,past,indc'),
+    ('раму', 'рама', 'S,жен,неод=вин,ед', 'NOUN,inan,femn sing,accs'),
+    ('во', 'в', 'PR=', 'PREP'),
+    ('второй', 'второй', 'ANUM=(пр,ед,жен|дат,ед,жен)', 'ADJF,Anum femn,sing,loct'),
+    ('реке', 'река', 'S,жен,неод=(пр,ед|дат,ед)', 'NOUN,inan,femn sing,loct'),
+]
+
+
+def make_mystem_output(number_of_tokens: int) -> str:
+    """
+    Builds Mystem-like JSON, so that every parsed string is a separate object
+    """
+    random.seed(number_of_tokens)
+    items = []
+    for _ in range(number_of_tokens):
+        word, lemma, tags_mystem, _ = random.choice(ANALYSES)
+        items.append({'analysis': [{'lex': lemma, 'gr': tags_mystem}], 'text': word})
+    return json.dumps(items, ensure_ascii=False)
+
+
+class LegacyToken:
+    """
+    Token as stored before __slots__ and columnar storage
+    """
+
+    def __init__(self, original_word):
+        self.original_word = original_word
+        self.normalized_form = ''
+        self.tags_mystem = ''
+        self.tags_pymorphy = ''
+
+
+def build_objects(analyzed_text: list, tags_pymorphy: dict):
+    """
+    Stores every token as a separate object
+    """
+    tokens = []
+    for item in analyzed_text:
+        token = LegacyToken(item['text'])
+        token.normalized_form = item['analysis'][0]['lex']
+        token.tags_mystem = item['analysis'][0]['gr']
+        token.tags_pymorphy = tags_pymorphy[item['text']]
+        tokens.append(token)
+    return tokens
+
+
+def build_columns(analyzed_text: list, tags_pymorphy: dict):
+    """
+    Stores tokens in a columnar container
+    """
+    tokens = MorphologicalTokens(TokenVocabulary())
+    for item in analyzed_text:
+        tokens.append(item['text'], item['analysis'][0]['lex'],
+                      item['analysis'][0]['gr'], tags_pymorphy[item['text']])
+    next(tokens.get_cleaned(), None)  # moves surface forms into one buffer
+    return tokens
+
+
+def measure(builder, raw_output: str, tags_pymorphy: dict) -> int:
+    """
+    Returns memory allocated for built tokens in bytes.
+    Strings parsed from Mystem output are not counted,
+    though token objects keep them alive
+    """
+    analyzed_text = json.loads(raw_output)
+    tracemalloc.start()
+    tokens = builder(analyzed_text, tags_pymorphy)
+    del analyzed_text
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tokens
+    return used
+
+
+def main():
+    tags_pymorphy = {word: tags for word, _, _, tags in ANALYSES}
+    for number_of_tokens in (10000, 100000, 500000):
+        raw_output = make_mystem_output(number_of_tokens)
+        objects = measure(build_objects, raw_output, tags_pymorphy)
+        columns = measure(build_columns, raw_output, tags_pymorphy)
+        print(f'{number_of_tokens:>7} tokens: objects {objects / 2 ** 20:7.1f} MB, '
+              f'columns {columns / 2 ** 20:6.1f} MB, '
+              f'{objects / columns:4.1f}x less')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark of drawing POS frequency charts with a new pyplot figure per chart
+and with the batch renderer
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+# pylint: disable=wrong-import-position
+from core_utils.visualizer import COLORS, visualize_batch
+
+NUMBER_OF_CHARTS = 200
+STATISTICS = {'S': 120, 'V': 60, 'A': 45, 'PR': 40, 'ADV': 20, 'CONJ': 18, 'SPRO': 15,
+              'PART': 10, 'APRO': 9, 'NUM': 5, 'ADVPRO': 4, 'ANUM': 3, 'INTJ': 1}
+
+
+def visualize_with_pyplot(statistics: dict, path_to_save: Path):
+    """
+    Draws a chart the way the visualizer used to: a pyplot figure per chart,
+    a bar per tag and no figure closing
+    """
+    sorted_frequencies = sorted(statistics.values(), reverse=True)
+    sorted_tags = sorted(statistics, key=statistics.get, reverse=True)
+    figure = plt.figure()
+    axis = figure.add_subplot(1, 1, 1)
+    for i, frequency in enumerate(sorted_frequencies):
+        axis.bar(i, frequency, align='center', width=0.5, color=COLORS[i % len(COLORS)])
+    axis.set_xticks(range(len(sorted_tags)))
+    axis.set_xticklabels(sorted_tags)
+    plt.xticks(rotation=20)
+    plt.ylim(0, max(sorted_frequencies) + 1)
+    plt.savefig(path_to_save)
+
+
+def main():
+    matplotlib.use('Agg')
+    with tempfile.TemporaryDirectory() as directory:
+        charts = [(STATISTICS, Path(directory) / f'{index}_image.png')
+                  for index in range(NUMBER_OF_CHARTS)]
+
+        start = time.perf_counter()
+        for statistics, path in charts:
+            visualize_with_pyplot(statistics, path)
+        print(f'pyplot figure per chart: {time.perf_counter() - start:.2f} s, '
+              f'{len(plt.get_fignums())} figures left open')
+        plt.close('all')
+
+        for workers in sorted({1, os.cpu_count()}):
+            start = time.perf_counter()
+            visualize_batch(charts, workers=workers)
+            print(f'batch renderer, {workers} workers: {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Resumable crawl validation against a local stand-in server
+"""
+import shutil
+import unittest
+
+import pytest
+
+from constants import ASSETS_PATH, PROJECT_ROOT
+from scrapper import ArticleCollector, CrawlCheckpoint, prepare_environment
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+TEST_TMP = PROJECT_ROOT / 'tmp_checkpoint_tests'
+CHECKPOINT_PATH = PROJECT_ROOT / 'tmp_crawl_checkpoint.json'
+
+
+class CrawlCheckpointTest(unittest.TestCase):
+    """
+    Tests for resuming an interrupted collection from a checkpoint
+    """
+
+    def setUp(self) -> None:
+        if ASSETS_PATH.exists():
+            shutil.move(str(ASSETS_PATH), str(TEST_TMP))
+        ASSETS_PATH.mkdir(parents=True)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_10_crawl_checkpoint_check
+    def test_saved_articles_are_not_collected_again(self):
+        """
+        Ensure only articles missing from the checkpoint are downloaded on resume
+        """
+        paths = [f'/text/news/2022/04/28/{index}/' for index in range(1, 5)]
+        with StandInServer() as server:
+            urls = [server.article_url(path) for path in paths]
+            checkpoint = CrawlCheckpoint(CHECKPOINT_PATH)
+            checkpoint.urls = urls
+            for url in urls:
+                checkpoint.get_article_id(url)
+            checkpoint.completed = {1, 3}
+            checkpoint.save()
+            for article_id in checkpoint.completed:
+                (ASSETS_PATH / f'{article_id}_raw.txt').write_text('saved', encoding='utf-8')
+
+            restored = CrawlCheckpoint(CHECKPOINT_PATH)
+            self.assertEqual(urls, restored.urls)
+            self.assertEqual({1, 3}, restored.completed)
+            self.assertEqual(4, restored.get_article_id(urls[-1]))
+
+            errors = ArticleCollector(fetch_workers=2, parse_workers=1,
+                                      requests_per_second=1000).collect(urls, restored)
+            self.assertEqual({}, errors)
+            self.assertEqual(2, len(server.request_times))
+
+        self.assertEqual('saved', (ASSETS_PATH / '1_raw.txt').read_text(encoding='utf-8'))
+        self.assertTrue((ASSETS_PATH / '2_raw.txt').exists())
+        self.assertTrue((ASSETS_PATH / '4_raw.txt').exists())
+        self.assertFalse(CHECKPOINT_PATH.exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_10_crawl_checkpoint_check
+    def test_articles_missing_from_disk_are_collected_again(self):
+        """
+        Ensure articles recorded as saved are collected again if their raw texts are gone
+        """
+        urls = [f'https://www.nn.ru/text/news/2022/04/28/{index}/' for index in range(1, 5)]
+        checkpoint = CrawlCheckpoint(CHECKPOINT_PATH)
+        checkpoint.completed = {1, 2, 3, 4}
+        for article_id in (1, 3):
+            (ASSETS_PATH / f'{article_id}_raw.txt').write_text('saved', encoding='utf-8')
+        pending = ArticleCollector._get_pending(urls, checkpoint)  # pylint: disable=protected-access
+        self.assertEqual([(2, urls[1]), (4, urls[3])], pending)
+        self.assertEqual({1, 3}, CrawlCheckpoint(CHECKPOINT_PATH).completed)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_10_crawl_checkpoint_check
+    def test_environment_is_kept_on_resume(self):
+        """
+        Ensure collected articles are wiped only for a fresh crawl
+        """
+        (ASSETS_PATH / '1_raw.txt').write_text('text', encoding='utf-8')
+        prepare_environment(ASSETS_PATH, fresh=False)
+        self.assertTrue((ASSETS_PATH / '1_raw.txt').exists())
+        prepare_environment(ASSETS_PATH)
+        self.assertEqual([], list(ASSETS_PATH.iterdir()))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(ASSETS_PATH)
+        if CHECKPOINT_PATH.exists():
+            CHECKPOINT_PATH.unlink()
+        if TEST_TMP.exists():
+            shutil.move(str(TEST_TMP), str(ASSETS_PATH))
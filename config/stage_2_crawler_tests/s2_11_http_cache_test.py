@@ -0,0 +1,87 @@
+"""
+HTTP response cache validation against a local stand-in server
+"""
+import tempfile
+import unittest
+from unittest import mock
+
+import pytest
+
+from core_utils.http_cache import CacheMissError, HTTPResponseCache
+from core_utils.http_client import HTTPClient
+from scrapper import Crawler, HTMLParser
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+
+class HTTPCacheTest(unittest.TestCase):
+    """
+    Tests for conditional requests, offline replay and reuse of parsed fields
+    """
+
+    def setUp(self) -> None:
+        self.cache_directory = tempfile.TemporaryDirectory()
+        self.cache = HTTPResponseCache(self.cache_directory.name)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_11_http_cache_check
+    def test_unchanged_page_is_served_from_cache(self):
+        """
+        Ensure a repeated request is conditional and a 304 answer is served from disk
+        """
+        with StandInServer() as server, HTTPClient(cache=self.cache) as client:
+            first = client.get(server.page_url(1))
+            second = client.get(server.page_url(1))
+            self.assertEqual(1, server.not_modified)
+        self.assertEqual(200, second.status_code)
+        self.assertEqual(first.text, second.text)
+        self.assertEqual(1, client.get_statistics()['cache_hits'])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_11_http_cache_check
+    def test_offline_client_replays_cache(self):
+        """
+        Ensure an offline client needs no network and fails on pages it has never seen
+        """
+        with StandInServer() as server, HTTPClient(cache=self.cache) as client:
+            url = server.page_url(1)
+            expected = client.get(url).text
+        with HTTPClient(cache=self.cache, offline=True) as offline_client:
+            self.assertEqual(expected, offline_client.get(url).text)
+            with self.assertRaises(CacheMissError):
+                offline_client.get(server.page_url(2))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_11_http_cache_check
+    def test_offline_crawl_stops_on_missing_page(self):
+        """
+        Ensure a listing page missing from the cache is treated as failed, not as a crash
+        """
+        with StandInServer() as server, HTTPClient(cache=self.cache) as client:
+            seed_urls = [server.page_url(1)]
+            Crawler(seed_urls, 100, client=client).find_articles()
+            listing_url = server.base_url + '/text/?page={page}'
+        for concurrency in (1, 3):
+            with HTTPClient(cache=self.cache, offline=True) as offline_client:
+                crawler = Crawler(seed_urls, 100, concurrency=concurrency, client=offline_client,
+                                  max_pages=5, listing_url=listing_url)
+                crawler.find_articles()
+            self.assertTrue(crawler.urls)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_11_http_cache_check
+    def test_unchanged_article_is_not_parsed_again(self):
+        """
+        Ensure fields parsed from an unchanged article are restored without parsing HTML
+        """
+        with StandInServer() as server, HTTPClient(cache=self.cache) as client:
+            url = server.article_url('/text/news/2022/04/28/1/')
+            parsed = HTMLParser(url, 1, client).parse()
+            with mock.patch.object(HTMLParser, 'parse_html') as parse_html:
+                restored = HTMLParser(url, 1, client).parse()
+            parse_html.assert_not_called()
+        self.assertEqual(parsed.text, restored.text)
+        self.assertEqual(parsed.date, restored.date)
+        self.assertEqual(parsed.topics, restored.topics)
+
+    def tearDown(self) -> None:
+        self.cache_directory.cleanup()
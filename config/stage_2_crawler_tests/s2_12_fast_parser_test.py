@@ -0,0 +1,63 @@
+"""
+Fast HTML parsing validation
+"""
+import unittest
+
+import pytest
+
+from constants import PROJECT_ROOT
+from scrapper import HTMLParser
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+ARTICLE_PAGE_PATH = PROJECT_ROOT / 'config' / 'test_files' / 'article_page.html'
+
+
+def parse(html: str, fast: bool) -> dict:
+    """
+    Parses a page in a given mode and returns the article fields
+    """
+    parser = HTMLParser('https://www.nn.ru/text/city/2022/04/28/71287098/', 1,
+                        client=object(), fast=fast)
+    parser.parse_html(html)
+    return parser.get_fields()
+
+
+class FastHTMLParserTest(unittest.TestCase):
+    """
+    Tests for HTMLParser fast mode
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_12_fast_parser_check
+    def test_saved_page_is_parsed_as_in_full_mode(self):
+        """
+        Ensure fast mode gives the same article as parsing the whole page
+        """
+        html = ARTICLE_PAGE_PATH.read_text(encoding='utf-8')
+        fields = parse(html, fast=True)
+        self.assertEqual(parse(html, fast=False), fields)
+        self.assertEqual(['Город', 'Благоустройство', 'Город'], fields['topics'])
+        self.assertEqual('2022-04-28T18:01:00', fields['date'])
+        self.assertTrue(fields['text'].startswith('Сквер на Покровке открыли'))
+        self.assertNotIn('Второй абзац', fields['text'])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_12_fast_parser_check
+    def test_stand_in_pages_are_parsed_as_in_full_mode(self):
+        """
+        Ensure fast mode gives the same articles on pages of the stand-in server
+        """
+        with StandInServer() as server:
+            pages = [server.render_page(f'/text/news/2022/04/28/{index}/') for index in range(1, 4)]
+        for html in pages:
+            self.assertEqual(parse(html, fast=False), parse(html, fast=True))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_12_fast_parser_check
+    def test_page_unreadable_by_lxml_falls_back_to_full_mode(self):
+        """
+        Ensure a page with an encoding declaration is still parsed
+        """
+        html = ('<?xml version="1.0" encoding="utf-8"?>'
+                + ARTICLE_PAGE_PATH.read_text(encoding='utf-8'))
+        self.assertEqual(parse(html, fast=False), parse(html, fast=True))
@@ -0,0 +1,112 @@
+"""
+Politeness scheduler validation
+"""
+import unittest
+from email.utils import formatdate
+from time import monotonic, time
+
+import pytest
+import requests
+
+from core_utils.http_client import (DEFAULT_REQUESTS_PER_SECOND, PolitenessScheduler,
+                                    get_default_client)
+from scrapper import ArticleCollector, Crawler
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+URL = 'https://www.nn.ru/text/'
+
+
+def make_response(status_code: int, retry_after: str = None) -> requests.Response:
+    """
+    Builds a response with a given status and Retry-After header
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+class PolitenessSchedulerTest(unittest.TestCase):
+    """
+    Tests for PolitenessScheduler realization
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_requests_are_spaced_by_budget(self):
+        """
+        Ensure each next request to a host waits one more interval, other hosts do not wait
+        """
+        scheduler = PolitenessScheduler(requests_per_second=10)
+        delays = [scheduler.reserve(URL) for _ in range(4)]
+        for expected, delay in zip((0.0, 0.1, 0.2, 0.3), delays):
+            self.assertAlmostEqual(expected, delay, delta=0.01)
+        self.assertEqual(0.0, scheduler.reserve('https://www.google.com/'))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_burst_is_allowed(self):
+        """
+        Ensure a bucket holds several tokens if configured
+        """
+        scheduler = PolitenessScheduler(requests_per_second=10, burst=3)
+        delays = [scheduler.reserve(URL) for _ in range(4)]
+        self.assertEqual([0.0, 0.0, 0.0], delays[:3])
+        self.assertGreater(delays[3], 0.05)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_rate_adapts_to_pushback(self):
+        """
+        Ensure 429 halves the rate and pauses the host, successes restore the rate
+        """
+        scheduler = PolitenessScheduler(requests_per_second=10)
+        scheduler.report(URL, make_response(429, '2'))
+        self.assertEqual(5, scheduler.get_rate(URL))
+        self.assertAlmostEqual(2.0, scheduler.reserve(URL), delta=0.05)
+
+        for _ in range(10):
+            scheduler.report(URL, make_response(200))
+        self.assertEqual(10, scheduler.get_rate(URL))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_retry_after_date_is_honoured(self):
+        """
+        Ensure Retry-After given as an HTTP date pauses the host until that date
+        """
+        scheduler = PolitenessScheduler()
+        scheduler.report(URL, make_response(503, formatdate(time() + 3, usegmt=True)))
+        self.assertAlmostEqual(3.0, scheduler.reserve(URL), delta=1.0)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_crawler_runs_close_to_budget(self):
+        """
+        Ensure sequential crawling is paced by the budget instead of random sleeps
+        """
+        with StandInServer() as server:
+            seed_urls = [server.page_url(page) for page in range(1, 6)]
+            crawler = Crawler(seed_urls, 100, requests_per_second=20)
+            start = monotonic()
+            crawler.find_articles()
+            elapsed = monotonic() - start
+            request_times = server.request_times
+        average_gap = (request_times[-1] - request_times[0]) / (len(request_times) - 1)
+        self.assertGreater(average_gap, 0.045, request_times)
+        self.assertLess(elapsed, 2.0)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_13_politeness_scheduler_check
+    def test_budget_does_not_change_shared_client(self):
+        """
+        Ensure a budget given to a crawler or a collector applies to its own client only
+        """
+        crawler = Crawler([URL], 10, requests_per_second=1000)
+        collector = ArticleCollector(requests_per_second=1000)
+        self.assertEqual(1000, crawler.client.scheduler.requests_per_second)
+        self.assertEqual(1000, collector.client.scheduler.requests_per_second)
+        self.assertEqual(DEFAULT_REQUESTS_PER_SECOND,
+                         get_default_client().scheduler.requests_per_second)
+        self.assertIs(get_default_client(), Crawler([URL], 10).client)
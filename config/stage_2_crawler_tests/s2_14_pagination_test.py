@@ -0,0 +1,76 @@
+"""
+Pagination-aware crawling validation against a local stand-in server
+"""
+import unittest
+
+import pytest
+
+from scrapper import Crawler
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+
+def make_crawler(server: StandInServer, seed_pages, max_articles: int, **kwargs) -> Crawler:
+    """
+    Creates a crawler generating listing pages of the stand-in server
+    """
+    return Crawler([server.page_url(page) for page in seed_pages], max_articles,
+                   requests_per_second=1000, max_pages=50,
+                   listing_url=server.base_url + '/text/?page={page}', **kwargs)
+
+
+class PaginationTest(unittest.TestCase):
+    """
+    Tests for lazy generation of listing pages in Crawler
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_14_pagination_check
+    def test_pages_are_generated_until_frontier_is_full(self):
+        """
+        Ensure pages after the seeds are fetched only while more articles are needed
+        """
+        with StandInServer(links_per_page=5) as server:
+            crawler = make_crawler(server, [1], 12)
+            crawler.find_articles()
+            paths = list(server.paths)
+        self.assertEqual(12, len(crawler.urls))
+        self.assertEqual(['/text/?page=1', '/text/?page=2', '/text/?page=3'], paths)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_14_pagination_check
+    def test_seeds_are_not_exhausted_needlessly(self):
+        """
+        Ensure the crawler stops at the first seed page that fills the frontier
+        """
+        with StandInServer(links_per_page=5) as server:
+            crawler = make_crawler(server, range(1, 11), 5)
+            crawler.find_articles()
+            self.assertEqual(['/text/?page=1'], server.paths)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_14_pagination_check
+    def test_crawling_stops_at_end_of_listing(self):
+        """
+        Ensure a generated page without new articles stops the crawler
+        """
+        with StandInServer(links_per_page=5, last_page=3) as server:
+            crawler = make_crawler(server, [1], 100)
+            crawler.find_articles()
+            paths = list(server.paths)
+        self.assertEqual(15, len(crawler.urls))
+        self.assertEqual([f'/text/?page={page}' for page in range(1, 5)], paths)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_14_pagination_check
+    def test_next_pages_are_prefetched(self):
+        """
+        Ensure asynchronous crawler fetches pages ahead within the concurrency budget
+        """
+        with StandInServer(links_per_page=5, delay=0.1, last_page=6) as server:
+            crawler = make_crawler(server, [1], 100, concurrency=3)
+            crawler.find_articles()
+            max_in_flight = server.max_in_flight
+            requests_made = len(server.paths)
+        self.assertEqual(30, len(crawler.urls))
+        self.assertEqual(3, max_in_flight)
+        self.assertLessEqual(requests_made, 6 + 3)
@@ -0,0 +1,58 @@
+"""
+Asynchronous crawling validation against a local stand-in server
+"""
+import unittest
+
+import pytest
+
+from scrapper import Crawler
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+
+class AsyncCrawlerTest(unittest.TestCase):
+    """
+    Tests for Crawler in asynchronous mode
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_6_async_crawler_check
+    def test_crawler_collects_required_number_of_urls(self):
+        """
+        Ensure asynchronous crawler stops at max_articles and stores full unique URLs
+        """
+        with StandInServer(links_per_page=5) as server:
+            seed_urls = [server.page_url(page) for page in range(1, 5)]
+            crawler = Crawler(seed_urls, 12, concurrency=4, requests_per_second=100)
+            crawler.find_articles()
+        self.assertEqual(12, len(crawler.urls))
+        self.assertEqual(len(crawler.urls), len(set(crawler.urls)))
+        self.assertTrue(all(url.startswith('http') for url in crawler.urls))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_6_async_crawler_check
+    def test_concurrency_limit_is_respected(self):
+        """
+        Ensure no more than the configured number of requests are in flight
+        """
+        with StandInServer(delay=0.2) as server:
+            seed_urls = [server.page_url(page) for page in range(1, 9)]
+            crawler = Crawler(seed_urls, 100, concurrency=3, requests_per_second=1000)
+            crawler.find_articles()
+            self.assertEqual(8, len(server.request_times))
+            self.assertLessEqual(server.max_in_flight, 3)
+            self.assertGreater(server.max_in_flight, 1)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_6_async_crawler_check
+    def test_host_rate_limit_is_respected(self):
+        """
+        Ensure requests to one host are spaced by the rate limit
+        """
+        with StandInServer() as server:
+            seed_urls = [server.page_url(page) for page in range(1, 6)]
+            crawler = Crawler(seed_urls, 100, concurrency=5, requests_per_second=20)
+            crawler.find_articles()
+            request_times = sorted(server.request_times)
+        self.assertEqual(5, len(request_times))
+        average_gap = (request_times[-1] - request_times[0]) / (len(request_times) - 1)
+        self.assertGreater(average_gap, 0.045, request_times)
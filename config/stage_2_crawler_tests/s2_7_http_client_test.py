@@ -0,0 +1,66 @@
+"""
+HTTP client validation against a local stand-in server
+"""
+import unittest
+
+import pytest
+
+from core_utils.http_client import HTTPClient
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+
+class HTTPClientTest(unittest.TestCase):
+    """
+    Tests for HTTPClient realization
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_7_http_client_check
+    def test_connection_is_kept_alive(self):
+        """
+        Ensure consecutive requests reuse one pooled connection
+        """
+        with StandInServer() as server, HTTPClient() as client:
+            for page in range(1, 6):
+                self.assertTrue(client.get(server.page_url(page)).ok)
+            self.assertEqual(1, len(server.connections))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_7_http_client_check
+    def test_server_errors_are_retried(self):
+        """
+        Ensure 5xx responses are retried with backoff
+        """
+        with StandInServer(failures=2) as server, \
+                HTTPClient(retries=3, backoff_factor=0.01) as client:
+            response = client.get(server.page_url(1))
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(3, len(server.request_times))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_7_http_client_check
+    def test_pushback_is_reported_to_scheduler(self):
+        """
+        Ensure 503 responses are retried through the scheduler, slowing requests to the host
+        """
+        with StandInServer(failures=1) as server, \
+                HTTPClient(requests_per_second=100) as client:
+            response = client.get(server.page_url(1))
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(2, len(server.request_times))
+            self.assertLess(client.scheduler.get_rate(server.page_url(1)), 100)
+            self.assertGreater(server.request_times[1] - server.request_times[0], 0.9)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_7_http_client_check
+    def test_request_timings_are_collected(self):
+        """
+        Ensure client measures each request
+        """
+        with StandInServer(delay=0.05) as server, HTTPClient() as client:
+            client.get(server.page_url(1))
+            client.get(server.page_url(2))
+        statistics = client.get_statistics()
+        self.assertEqual(2, statistics['requests'])
+        self.assertGreaterEqual(statistics['max_time'], 0.05)
+        self.assertGreaterEqual(statistics['total_time'], 0.1)
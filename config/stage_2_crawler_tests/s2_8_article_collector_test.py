@@ -0,0 +1,66 @@
+"""
+Concurrent article collection validation against a local stand-in server
+"""
+import json
+import shutil
+import unittest
+
+import pytest
+
+from constants import ASSETS_PATH, PROJECT_ROOT
+from scrapper import ArticleCollector
+from config.stage_2_crawler_tests.stand_in_server import StandInServer
+
+TEST_TMP = PROJECT_ROOT / 'tmp_collector_tests'
+
+
+class ArticleCollectorTest(unittest.TestCase):
+    """
+    Tests for ArticleCollector realization
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if ASSETS_PATH.exists():
+            shutil.move(str(ASSETS_PATH), str(TEST_TMP))
+        ASSETS_PATH.mkdir(parents=True)
+
+        paths = [f'/text/news/2022/04/28/{index}/' for index in range(1, 7)]
+        # later articles arrive first
+        delays = {path: 0.05 * (len(paths) - index) for index, path in enumerate(paths)}
+        with StandInServer(delays=delays) as server:
+            cls.urls = [server.article_url(path) for path in paths]
+            collector = ArticleCollector(fetch_workers=6, parse_workers=2,
+                                         requests_per_second=1000)
+            cls.errors = collector.collect(cls.urls)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_8_article_collector_check
+    def test_all_articles_are_saved(self):
+        """
+        Ensure every article is downloaded, parsed and saved
+        """
+        self.assertEqual({}, self.errors)
+        for article_id in range(1, len(self.urls) + 1):
+            self.assertTrue((ASSETS_PATH / f'{article_id}_raw.txt').exists())
+            self.assertTrue((ASSETS_PATH / f'{article_id}_meta.json').exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_8_article_collector_check
+    def test_ids_follow_order_of_urls(self):
+        """
+        Ensure article ids do not depend on the order pages arrive in
+        """
+        for article_id, url in enumerate(self.urls, start=1):
+            with open(ASSETS_PATH / f'{article_id}_meta.json', encoding='utf-8') as file:
+                meta = json.load(file)
+            self.assertEqual(url, meta['url'])
+            self.assertEqual(article_id, meta['id'])
+            with open(ASSETS_PATH / f'{article_id}_raw.txt', encoding='utf-8') as file:
+                self.assertIn(url.split('/', 3)[-1], file.read())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(ASSETS_PATH)
+        if TEST_TMP.exists():
+            shutil.move(str(TEST_TMP), str(ASSETS_PATH))
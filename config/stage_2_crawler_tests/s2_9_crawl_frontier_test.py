@@ -0,0 +1,56 @@
+"""
+Crawl frontier validation
+"""
+import unittest
+
+import pytest
+
+from scrapper import CrawlFrontier
+
+
+class CrawlFrontierTest(unittest.TestCase):
+    """
+    Tests for CrawlFrontier de-duplication and limits
+    """
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_9_crawl_frontier_check
+    def test_equivalent_urls_are_added_once(self):
+        """
+        Ensure URLs differing in query, fragment, host case or trailing slash are duplicates
+        """
+        frontier = CrawlFrontier(10)
+        self.assertTrue(frontier.add('https://www.nn.ru/text/news/2022/04/28/71287100/'))
+        for duplicate in ('https://www.nn.ru/text/news/2022/04/28/71287100',
+                          'https://WWW.nn.ru/text/news/2022/04/28/71287100/?utm_source=main',
+                          'https://www.nn.ru/text/news/2022/04/28/71287100/#comments'):
+            self.assertFalse(frontier.add(duplicate))
+        self.assertEqual(['https://www.nn.ru/text/news/2022/04/28/71287100/'], frontier.urls)
+        self.assertIn('https://www.nn.ru/text/news/2022/04/28/71287100?page=2', frontier)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_9_crawl_frontier_check
+    def test_frontier_stops_at_max_size(self):
+        """
+        Ensure the frontier keeps insertion order and rejects URLs once full
+        """
+        frontier = CrawlFrontier(3)
+        urls = [f'https://www.nn.ru/text/news/{index}/' for index in range(5)]
+        added = [frontier.add(url) for url in urls]
+        self.assertEqual([True, True, True, False, False], added)
+        self.assertTrue(frontier.is_full)
+        self.assertEqual(urls[:3], frontier.urls)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_9_crawl_frontier_check
+    def test_bloom_filter_mode_matches_exact_mode(self):
+        """
+        Ensure Bloom filter membership gives the same frontier on a small crawl
+        """
+        urls = [f'https://www.nn.ru/text/news/{index % 700}/' for index in range(2000)]
+        exact, bloom = CrawlFrontier(500), CrawlFrontier(500, use_bloom_filter=True,
+                                                          expected_urls=10000)
+        for url in urls:
+            exact.add(url)
+            bloom.add(url)
+        self.assertEqual(exact.urls, bloom.urls)
@@ -0,0 +1,129 @@
+"""
+Local HTTP server standing in for nn.ru in crawler tests
+"""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StandInServer:
+    """
+    Serves listing pages with links to articles and records incoming requests
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, links_per_page: int = 5, delay: float = 0.0, failures: int = 0,
+                 delays: dict = None, last_page: int = None):
+        # pylint: disable=too-many-arguments
+        self.links_per_page = links_per_page
+        self.last_page = last_page
+        self.delay = delay
+        self.delays = delays or {}
+        self.failures = failures
+        self.request_times = []
+        self.paths = []
+        self.not_modified = 0
+        self.connections = set()
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def base_url(self):
+        """
+        Returns URL of the server root
+        """
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def page_url(self, page: int):
+        """
+        Returns URL of a listing page
+        """
+        return f'{self.base_url}/text/?page={page}'
+
+    def article_url(self, path: str):
+        """
+        Returns URL of an article page
+        """
+        return f'{self.base_url}{path}'
+
+    def render_page(self, path: str):
+        """
+        Returns HTML of an article page or a listing page with links to articles,
+        listing pages after the last page have no links
+        """
+        if path.startswith('/text/news/'):
+            return ('<html><body>'
+                    '<a data-test="archive-record-header" href="/text/city/">Город</a>'
+                    '<time datetime="2022-04-28T18:01:00">28 апреля 2022, 18:01</time>'
+                    f'<div class="_25BQZ"><p>Текст статьи {path}. <b>Подробности</b> позже.</p></div>'
+                    '<a target="_self" href="/text/news/2022/04/28/1/">ещё</a>'
+                    '</body></html>')
+        page = int(parse_qs(urlsplit(path).query).get('page', ['1'])[0])
+        if self.last_page is not None and page > self.last_page:
+            return '<html><body><div></div></body></html>'
+        links = ''.join(f'<a target="_self" href="/text/news/2022/04/28/{page}{index:03d}/">news</a>'
+                        for index in range(self.links_per_page))
+        return f'<html><body><div>{links}</div></body></html>'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Handles requests to the stand-in server
+            """
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Serves a page after an optional delay,
+                the first requests fail if failures are configured,
+                unchanged pages are answered with 304 to conditional requests
+                """
+                with server._lock:  # pylint: disable=protected-access
+                    server.request_times.append(time.monotonic())
+                    server.paths.append(self.path)
+                    server.connections.add(self.client_address)
+                    server._in_flight += 1  # pylint: disable=protected-access
+                    server.max_in_flight = max(server.max_in_flight,
+                                               server._in_flight)  # pylint: disable=protected-access
+                    failed = server.failures > 0
+                    server.failures -= failed
+                time.sleep(server.delays.get(self.path, server.delay))
+                body = server.render_page(self.path).encode('utf-8')
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                not_modified = not failed and self.headers.get('If-None-Match') == etag
+                if not_modified:
+                    with server._lock:  # pylint: disable=protected-access
+                        server.not_modified += 1
+                    body = b''
+                self.send_response(503 if failed else 304 if not_modified else 200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:  # pylint: disable=protected-access
+                    server._in_flight -= 1  # pylint: disable=protected-access
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """
+                Keeps test output clean
+                """
+
+        return Handler
@@ -0,0 +1,101 @@
+"""
+Tests for single-pass dataset validation
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pipeline import InconsistentDatasetError, validate_dataset
+
+
+class DatasetValidationTest(unittest.TestCase):
+    """
+    Tests for reporting of dataset inconsistencies
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        for article_id in (1, 2, 3, 5, 6, 7):
+            (self.path / f'{article_id}_raw.txt').write_text('' if article_id in (2, 6) else 'текст',
+                                                             encoding='utf-8')
+        for article_id in (1, 2, 3, 5, 6):
+            (self.path / f'{article_id}_meta.json').write_text('{}', encoding='utf-8')
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_dataset_validation_checks
+    def test_every_inconsistency_is_reported(self):
+        """
+        Ensure gaps in numeration, empty texts and missing meta files are reported together
+        """
+        with self.assertRaises(InconsistentDatasetError) as context:
+            validate_dataset(self.path)
+        message = str(context.exception)
+        self.assertIn('raw texts are missing for ids: 4', message)
+        self.assertIn('raw texts are empty for ids: 2, 6', message)
+        self.assertIn('meta files are missing for ids: 7', message)
+        self.assertNotRegex(message, 'ids: (,|;|$)')
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_dataset_validation_checks
+    def test_raw_texts_are_not_read(self):
+        """
+        Ensure validation does not open files and gives the same result in parallel
+        """
+        (self.path / '4_raw.txt').write_text('текст', encoding='utf-8')
+        (self.path / '4_meta.json').write_text('{}', encoding='utf-8')
+        (self.path / '7_meta.json').write_text('{}', encoding='utf-8')
+        (self.path / '2_raw.txt').write_text('текст', encoding='utf-8')
+        (self.path / '6_raw.txt').write_text('текст', encoding='utf-8')
+        with mock.patch('builtins.open', side_effect=AssertionError):
+            validate_dataset(self.path)
+            validate_dataset(self.path, workers=4)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_dataset_validation_checks
+    def test_parallel_validation_finds_empty_texts(self):
+        """
+        Ensure the parallel mode reports the same issues as the sequential one
+        """
+        with self.assertRaises(InconsistentDatasetError) as sequential:
+            validate_dataset(self.path)
+        with self.assertRaises(InconsistentDatasetError) as parallel:
+            validate_dataset(self.path, workers=4)
+        self.assertEqual(str(sequential.exception), str(parallel.exception))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_dataset_validation_checks
+    def test_numeration_from_zero_is_reported(self):
+        """
+        Ensure ids below 1 are reported even if the rest of the dataset is consistent
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for article_id in range(3):
+                (Path(directory) / f'{article_id}_raw.txt').write_text('текст', encoding='utf-8')
+                (Path(directory) / f'{article_id}_meta.json').write_text('{}', encoding='utf-8')
+            with self.assertRaises(InconsistentDatasetError) as context:
+                validate_dataset(directory)
+        self.assertIn('numeration must start from 1, found ids: 0', str(context.exception))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_10_dataset_validation_checks
+    def test_mismatched_meta_files_are_reported(self):
+        """
+        Ensure meta files are matched with raw texts by id, not only by number
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for article_id in (1, 2):
+                (Path(directory) / f'{article_id}_raw.txt').write_text('текст', encoding='utf-8')
+            for article_id in (1, 3):
+                (Path(directory) / f'{article_id}_meta.json').write_text('{}', encoding='utf-8')
+            with self.assertRaises(InconsistentDatasetError) as context:
+                validate_dataset(directory)
+        message = str(context.exception)
+        self.assertIn('meta files are missing for ids: 2', message)
+        self.assertIn('raw texts are missing for ids: 3', message)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
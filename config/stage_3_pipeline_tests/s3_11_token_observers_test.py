@@ -0,0 +1,119 @@
+"""
+Tests for token observers of TextProcessingPipeline
+"""
+import json
+import unittest
+from unittest import mock
+
+import pytest
+
+import pipeline
+from config.test_params import TemporaryDataset
+from pipeline import (CorpusManager, LemmaCounter, MorphologicalAnalyzers, MorphologicalTokens,
+                      POSCounter, TextProcessingPipeline, TokenVocabulary, VocabularyBuilder)
+
+
+ANALYSES = {
+    'Мама мыла раму': [('Мама', 'мама', 'S,жен,од=им,ед'),
+                       ('мыла', 'мыть', 'V,несов,пе=прош,ед,изъяв,жен'),
+                       ('раму', 'рама', 'S,жен,неод=вин,ед')],
+    'Красивая мама': [('Красивая', 'красивый', 'A=им,ед,полн,жен'),
+                      ('мама', 'мама', 'S,жен,од=им,ед')]
+}
+
+
+def make_tokens(analyses: list):
+    """
+    Builds token columns of a text without running analyzers
+    """
+    tokens = MorphologicalTokens(TokenVocabulary())
+    for original_word, normalized_form, tags_mystem in analyses:
+        tokens.append(original_word, normalized_form, tags_mystem, 'NOUN')
+    return tokens
+
+
+class TokenObserversTest(unittest.TestCase):
+    """
+    Tests for statistics collected while tokens are saved
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        self.assets_path = self.dataset.path
+        self.patches = [mock.patch.object(MorphologicalAnalyzers, 'open'),
+                        mock.patch.object(TextProcessingPipeline, '_process_batch',
+                                          side_effect=lambda raw_texts: [
+                                              make_tokens(ANALYSES[raw_text])
+                                              for raw_text in raw_texts])]
+        for patch in self.patches:
+            patch.start()
+        for article_id, text in enumerate(ANALYSES, start=1):
+            self.dataset.add_article(article_id, text)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_token_observers_checks
+    def test_article_statistics_are_saved_to_meta(self):
+        """
+        Ensure observers fill meta files in the same pass that writes tagged files
+        """
+        pos_counter = POSCounter()
+        TextProcessingPipeline(CorpusManager(self.assets_path),
+                               observers=[pos_counter, LemmaCounter()]).run()
+        with open(self.assets_path / '1_meta.json', encoding='utf-8') as file:
+            meta = json.load(file)
+        self.assertEqual({'S': 2, 'V': 1}, meta['pos_frequencies'])
+        self.assertEqual({'мама': 1, 'мыть': 1, 'рама': 1}, meta['lemma_frequencies'])
+        self.assertEqual('NOT FOUND', meta['author'])
+        self.assertEqual('мама<S,жен,од=им,ед> мыть<V,несов,пе=прош,ед,изъяв,жен> '
+                         'рама<S,жен,неод=вин,ед>',
+                         (self.assets_path / '1_single_tagged.txt').read_text(encoding='utf-8'))
+        self.assertEqual({'S': 3, 'V': 1, 'A': 1}, pos_counter.frequencies)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_token_observers_checks
+    def test_worker_statistics_are_merged(self):
+        """
+        Ensure statistics collected by worker processes add up to the corpus ones
+        """
+        vocabulary_builder = VocabularyBuilder()
+        main_pipeline = TextProcessingPipeline(CorpusManager(self.assets_path),
+                                               observers=[vocabulary_builder])
+        articles = main_pipeline.corpus_manager.get_articles()
+        pipeline._init_worker({'observers': [VocabularyBuilder()]})  # pylint: disable=protected-access
+        for article_id in (1, 2):
+            *_, observers = pipeline._process_in_worker(  # pylint: disable=protected-access
+                [articles[article_id]])
+            vocabulary_builder.merge(observers[0])
+        self.assertEqual({'мама': 2, 'мыть': 1, 'рама': 1, 'красивый': 1},
+                         vocabulary_builder.document_frequencies)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_token_observers_checks
+    def test_up_to_date_articles_are_observed(self):
+        """
+        Ensure articles skipped by the incremental mode are still shown to observers
+        """
+        manifest_path = self.assets_path.parent / 'manifest.json'
+        TextProcessingPipeline(CorpusManager(self.assets_path), manifest_path=manifest_path).run()
+        pos_counter = POSCounter()
+        TextProcessingPipeline(CorpusManager(self.assets_path), manifest_path=manifest_path,
+                               observers=[pos_counter]).run()
+        self.assertEqual({'S': 3, 'V': 1, 'A': 1}, pos_counter.frequencies)
+        with open(self.assets_path / '1_meta.json', encoding='utf-8') as file:
+            self.assertEqual({'S': 2, 'V': 1}, json.load(file)['pos_frequencies'])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_11_token_observers_checks
+    def test_pipeline_without_observers_keeps_meta(self):
+        """
+        Ensure meta files are not rewritten unless observers are given
+        """
+        TextProcessingPipeline(CorpusManager(self.assets_path)).run()
+        with open(self.assets_path / '2_meta.json', encoding='utf-8') as file:
+            self.assertNotIn('pos_frequencies', json.load(file))
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        pipeline._WORKER_PIPELINE = None  # pylint: disable=protected-access
+        self.dataset.cleanup()
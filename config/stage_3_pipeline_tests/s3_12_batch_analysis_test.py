@@ -0,0 +1,84 @@
+"""
+Tests for analysis of several articles with one Mystem call
+"""
+import re
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from core_utils.article import ArtifactType
+from pipeline import CorpusManager, MorphologicalAnalyzers, TextProcessingPipeline
+
+ITEM_PATTERN = re.compile(r'[а-яА-ЯёЁa-zA-Z]+|[^а-яА-ЯёЁa-zA-Z]+')
+TEXTS = ['Мама мыла раму.', '2022 — 100%', 'Красивая мама!', 'Река']
+
+
+def analyze(text: str) -> list:
+    """
+    Imitates Mystem output: a word gets an analysis,
+    a run of other characters becomes a single item without it
+    """
+    analyses = []
+    for item in ITEM_PATTERN.findall(text):
+        if item[0].isalpha():
+            analyses.append({'text': item, 'analysis': [{'lex': item.lower(), 'gr': 'S,жен=им,ед'}]})
+        else:
+            analyses.append({'text': item})
+    return analyses + [{'text': '\n'}]
+
+
+class BatchAnalysisTest(unittest.TestCase):
+    """
+    Tests for splitting Mystem output of a batch back into articles
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        for article_id, text in enumerate(TEXTS, start=1):
+            self.dataset.add_article(article_id, text)
+        self.patches = [mock.patch.object(MorphologicalAnalyzers, 'open'),
+                        mock.patch.object(MorphologicalAnalyzers, 'analyze',
+                                          side_effect=analyze),
+                        mock.patch.object(MorphologicalAnalyzers, 'get_pymorphy_tag',
+                                          return_value='NOUN,femn sing,nomn')]
+        for patch in self.patches:
+            patch.start()
+
+    def _run(self, batch_size: int) -> dict:
+        """
+        Processes the dataset and returns contents of all tagged files
+        """
+        TextProcessingPipeline(CorpusManager(self.dataset.path), batch_size=batch_size).run()
+        return {(article_id, kind): (self.dataset.path / f'{article_id}_{kind}.txt').read_bytes()
+                for article_id in range(1, len(TEXTS) + 1)
+                for kind in (ArtifactType.cleaned, ArtifactType.single_tagged,
+                             ArtifactType.multiple_tagged)}
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_12_batch_analysis_checks
+    def test_text_without_words_keeps_boundaries(self):
+        """
+        Ensure separators merged into one Mystem item still split the texts
+        """
+        artifacts = self._run(batch_size=len(TEXTS))
+        self.assertEqual(b'', artifacts[(2, ArtifactType.cleaned)])
+        self.assertEqual('красивая<S,жен=им,ед> мама<S,жен=им,ед>'.encode('utf-8'),
+                         artifacts[(3, ArtifactType.single_tagged)])
+        self.assertEqual('река'.encode('utf-8'), artifacts[(4, ArtifactType.cleaned)])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_12_batch_analysis_checks
+    def test_batches_give_identical_files(self):
+        """
+        Ensure processing articles in batches writes byte-identical files
+        """
+        separate = self._run(batch_size=1)
+        self.assertEqual(separate, self._run(batch_size=len(TEXTS)))
+        self.assertEqual(separate, self._run(batch_size=3))
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        self.dataset.cleanup()
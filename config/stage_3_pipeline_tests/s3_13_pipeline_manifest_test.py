@@ -0,0 +1,96 @@
+"""
+Tests for skipping articles whose artifacts are up to date
+"""
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from pipeline import (CorpusManager, MorphologicalAnalyzers, MorphologicalTokens,
+                      TextProcessingPipeline, TokenVocabulary)
+
+
+def make_tokens(raw_text: str):
+    """
+    Builds tokens of a text without running analyzers
+    """
+    tokens = MorphologicalTokens(TokenVocabulary())
+    for word in raw_text.split():
+        tokens.append(word, word.lower(), 'S,жен=им,ед', 'NOUN')
+    return tokens
+
+
+class PipelineManifestTest(unittest.TestCase):
+    """
+    Tests for PipelineManifest use by TextProcessingPipeline
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        for article_id in (1, 2, 3):
+            self.dataset.add_article(article_id, f'Текст статьи {article_id}')
+        self.manifest_path = self.dataset.path.parent / 'manifest.json'
+        self.skipped_articles = 0
+        self.analyzers_patch = mock.patch.object(MorphologicalAnalyzers, 'open')
+        self.analyzers_patch.start()
+        self._run()
+
+    def _run(self) -> list:
+        """
+        Runs the pipeline and returns raw texts that were processed
+        """
+        processed = []
+        with mock.patch.object(TextProcessingPipeline, '_process_batch',
+                               side_effect=lambda raw_texts: processed.extend(raw_texts) or [
+                                   make_tokens(raw_text) for raw_text in raw_texts]):
+            pipeline = TextProcessingPipeline(CorpusManager(self.dataset.path),
+                                              manifest_path=self.manifest_path)
+            pipeline.run()
+        self.skipped_articles = pipeline.skipped_articles
+        return processed
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_13_pipeline_manifest_checks
+    def test_up_to_date_articles_are_skipped(self):
+        """
+        Ensure a second run processes nothing
+        """
+        self.assertEqual([], self._run())
+        self.assertEqual(3, self.skipped_articles)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_13_pipeline_manifest_checks
+    def test_changed_raw_text_is_processed(self):
+        """
+        Ensure an article is processed again after its raw text changes
+        """
+        self.dataset.add_article(2, 'Новый текст')
+        self.assertEqual(['Новый текст'], self._run())
+        self.assertEqual('новый<S,жен=им,ед> текст<S,жен=им,ед>',
+                         (self.dataset.path / '2_single_tagged.txt').read_text(encoding='utf-8'))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_13_pipeline_manifest_checks
+    def test_missing_artifact_is_produced(self):
+        """
+        Ensure an article is processed again if one of its artifacts is missing
+        """
+        (self.dataset.path / '3_multiple_tagged.txt').unlink()
+        self.assertEqual(['Текст статьи 3'], self._run())
+        self.assertTrue((self.dataset.path / '3_multiple_tagged.txt').exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_13_pipeline_manifest_checks
+    def test_other_analyzers_version_makes_articles_out_of_date(self):
+        """
+        Ensure artifacts produced by other analyzers are produced again
+        """
+        with mock.patch('core_utils.pipeline_manifest.get_analyzers_version', return_value='pymystem3==0.1'):
+            self.assertEqual(3, len(self._run()))
+            self.assertEqual([], self._run())
+        self.assertEqual(3, len(self._run()))
+
+    def tearDown(self) -> None:
+        self.analyzers_patch.stop()
+        self.dataset.cleanup()
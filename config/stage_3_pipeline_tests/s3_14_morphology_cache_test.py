@@ -0,0 +1,112 @@
+"""
+Tests for persistent storage of word form analyses
+"""
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pipeline import MorphologicalTokens, MorphologyCache, TokenVocabulary
+
+
+def make_tokens(analyses: list):
+    """
+    Builds tokens from (word, lemma, Mystem tags) triples
+    """
+    tokens = MorphologicalTokens(TokenVocabulary())
+    for word, lemma, tags_mystem in analyses:
+        tokens.append(word, lemma, tags_mystem, 'NOUN')
+    return tokens
+
+
+class MorphologyCacheTest(unittest.TestCase):
+    """
+    Tests for MorphologyCache realization
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'morphology.sqlite'
+        self.cache = MorphologyCache(self.path)
+        self.cache.open()
+        self.cache.store(make_tokens([('мама', 'мама', 'S,жен,од=им,ед'),
+                                      ('мыла', 'мыть', 'V,несов,пе=прош,ед,изъяв,жен')]),
+                         ['qwzx'])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_known_text_is_taken_from_cache(self):
+        """
+        Ensure a text of stored words gets tokens, words Mystem could not analyze are dropped
+        """
+        tokens = self.cache.get_tokens(['мама', 'qwzx', 'мыла', 'мама'], TokenVocabulary())
+        self.assertEqual(['мама<S,жен,од=им,ед>', 'мыть<V,несов,пе=прош,ед,изъяв,жен>',
+                          'мама<S,жен,од=им,ед>'],
+                         list(tokens.get_single_tagged()))
+        self.assertEqual(1, self.cache.cached_articles)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_text_with_unknown_word_is_analyzed(self):
+        """
+        Ensure a text is analyzed again unless all its words are stored
+        """
+        self.assertIsNone(self.cache.get_tokens(['мама', 'раму'], TokenVocabulary()))
+        self.assertEqual(0, self.cache.cached_articles)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_unanalyzed_words_are_stored_as_null(self):
+        """
+        Ensure words without analysis are stored with empty lemma and tags
+        """
+        self.cache.close()
+        with sqlite3.connect(str(self.path)) as connection:
+            row = connection.execute('SELECT lemma, tags_mystem, tags_pymorphy, ambiguous '
+                                     "FROM words WHERE word = 'qwzx'").fetchone()
+        self.assertEqual((None, None, None, 0), row)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_differently_analyzed_word_is_not_trusted(self):
+        """
+        Ensure a word analyzed in another way in another context is marked ambiguous for good
+        """
+        self.cache.store(make_tokens([('мыла', 'мыло', 'S,сред,неод=род,ед')]), [])
+        self.assertIsNone(self.cache.get_tokens(['мыла'], TokenVocabulary()))
+        self.cache.store(make_tokens([('мыла', 'мыть', 'V,несов,пе=прош,ед,изъяв,жен')]), [])
+        self.assertIsNone(self.cache.get_tokens(['мыла'], TokenVocabulary()))
+        self.cache.store(make_tokens([('мама', 'мама', 'S,жен,од=им,ед')]), [])
+        self.assertIsNotNone(self.cache.get_tokens(['мама'], TokenVocabulary()))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_word_analyzed_differently_in_one_text_is_not_trusted(self):
+        """
+        Ensure a word with two analyses within a single text is marked ambiguous
+        """
+        self.cache.store(make_tokens([('стали', 'стать', 'V,нп=прош,мн,изъяв,сов'),
+                                      ('стали', 'сталь', 'S,жен,неод=род,ед')]), [])
+        self.assertIsNone(self.cache.get_tokens(['стали', 'стали'], TokenVocabulary()))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_14_morphology_cache_checks
+    def test_analyses_of_other_versions_are_dropped(self):
+        """
+        Ensure the storage is emptied when analyzers versions change
+        """
+        self.cache.close()
+        self.cache.open()
+        self.assertEqual(3, self.cache.size_on_open)
+        self.cache.close()
+        with mock.patch('pipeline.get_analyzers_version', return_value='pymystem3==0.1'):
+            self.cache.open()
+        self.assertEqual(0, self.cache.size_on_open)
+        self.assertIsNone(self.cache.get_tokens(['мама'], TokenVocabulary()))
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.directory.cleanup()
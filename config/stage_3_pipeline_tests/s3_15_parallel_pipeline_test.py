@@ -0,0 +1,94 @@
+"""
+Tests for processing articles in worker processes
+"""
+import unittest
+from unittest import mock
+
+import pytest
+
+import pipeline
+from config.test_params import TemporaryDataset
+from core_utils.article import ArtifactType
+from pipeline import (CorpusManager, MorphologicalAnalyzers, MorphologicalTokens,
+                      TextProcessingPipeline, TokenVocabulary)
+
+KINDS = (ArtifactType.cleaned, ArtifactType.single_tagged, ArtifactType.multiple_tagged)
+
+
+def process_batch(raw_texts: list):
+    """
+    Builds tokens of texts without running analyzers, fails on a broken text
+    """
+    batch = []
+    for raw_text in raw_texts:
+        if 'сломан' in raw_text:
+            raise ValueError('cannot analyze')
+        tokens = MorphologicalTokens(TokenVocabulary())
+        for word in raw_text.split():
+            tokens.append(word, word.lower(), 'S,жен=им,ед', 'NOUN')
+        batch.append(tokens)
+    return batch
+
+
+class ParallelPipelineTest(unittest.TestCase):
+    """
+    Tests for _init_worker and _process_in_worker
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        for article_id, text in enumerate(('Мама мыла раму', 'Текст сломан', 'Река'), start=1):
+            self.dataset.add_article(article_id, text)
+        self.patches = [mock.patch.object(MorphologicalAnalyzers, 'open'),
+                        mock.patch.object(TextProcessingPipeline, '_process_batch',
+                                          side_effect=process_batch)]
+        for patch in self.patches:
+            patch.start()
+        self.articles = CorpusManager(self.dataset.path).get_articles()
+
+    def _read_artifacts(self, article_ids) -> dict:
+        """
+        Returns contents of tagged files of given articles
+        """
+        return {(article_id, kind): self.articles[article_id].get_file_path(kind).read_bytes()
+                for article_id in article_ids for kind in KINDS}
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_15_parallel_pipeline_checks
+    def test_failed_article_is_reported_by_id(self):
+        """
+        Ensure a failing article does not stop its batch and its error is reported by id
+        """
+        pipeline._init_worker({'batch_size': 3})  # pylint: disable=protected-access
+        errors, _, raw_hashes, _ = pipeline._process_in_worker(  # pylint: disable=protected-access
+            [self.articles[article_id] for article_id in (1, 2, 3)])
+        self.assertEqual({2: 'ValueError: cannot analyze'}, errors)
+        self.assertEqual([1, 3], sorted(raw_hashes))
+        for kind in KINDS:
+            self.assertTrue(self.articles[1].get_file_path(kind).exists())
+            self.assertTrue(self.articles[3].get_file_path(kind).exists())
+            self.assertFalse(self.articles[2].get_file_path(kind).exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_15_parallel_pipeline_checks
+    def test_worker_output_matches_serial_run(self):
+        """
+        Ensure workers write the same files as processing in the current process
+        """
+        articles = [self.articles[1], self.articles[3]]
+        TextProcessingPipeline(None)._process_articles(articles)  # pylint: disable=protected-access
+        serial = self._read_artifacts((1, 3))
+        for article_id in (1, 3):
+            for kind in KINDS:
+                self.articles[article_id].get_file_path(kind).unlink()
+
+        pipeline._init_worker({'batch_size': 2})  # pylint: disable=protected-access
+        errors, *_ = pipeline._process_in_worker(articles)  # pylint: disable=protected-access
+        self.assertEqual({}, errors)
+        self.assertEqual(serial, self._read_artifacts((1, 3)))
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        pipeline._WORKER_PIPELINE = None  # pylint: disable=protected-access
+        self.dataset.cleanup()
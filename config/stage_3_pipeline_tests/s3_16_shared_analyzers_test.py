@@ -0,0 +1,88 @@
+"""
+Tests for analyzers shared by all articles of a pipeline run
+"""
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from pipeline import CorpusManager, TextProcessingPipeline
+
+
+def analyze(text: str) -> list:
+    """
+    Imitates Mystem output for a text of words separated by spaces
+    """
+    time.sleep(0.01)
+    return [{'text': word, 'analysis': [{'lex': word.lower(), 'gr': 'S,жен=им,ед'}]}
+            for word in text.split()] + [{'text': '\n'}]
+
+
+def create_morph_analyzer():
+    """
+    Imitates loading of pymorphy2 dictionaries
+    """
+    time.sleep(0.01)
+    return mock.Mock(parse=lambda word: [SimpleNamespace(tag='NOUN,inan,femn sing,nomn')])
+
+
+class SharedAnalyzersTest(unittest.TestCase):
+    """
+    Tests for MorphologicalAnalyzers use by TextProcessingPipeline
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        for article_id, text in enumerate(('Мама мыла раму', 'Красивая мама', 'Река'), start=1):
+            self.dataset.add_article(article_id, text)
+        self.mystem_patch = mock.patch('pipeline.Mystem')
+        self.morph_analyzer_patch = mock.patch('pipeline.pymorphy2.MorphAnalyzer',
+                                               side_effect=create_morph_analyzer)
+        self.mystem = self.mystem_patch.start()
+        self.mystem.return_value.analyze.side_effect = analyze
+        self.morph_analyzer = self.morph_analyzer_patch.start()
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_16_shared_analyzers_checks
+    def test_analyzers_are_started_once_per_run(self):
+        """
+        Ensure all articles of a run share analyzers closed after the run
+        """
+        pipeline = TextProcessingPipeline(CorpusManager(self.dataset.path))
+        pipeline.run()
+        self.assertEqual(1, self.mystem.call_count)
+        self.assertEqual(1, self.morph_analyzer.call_count)
+        self.mystem.return_value.start.assert_called_once()
+        self.assertEqual(3, self.mystem.return_value.analyze.call_count)
+        self.mystem.return_value.close.assert_called_once()
+        self.assertFalse(pipeline.analyzers.is_open)
+
+        summary = pipeline.get_summary()
+        self.assertGreaterEqual(summary['startup_time'], 0.01)
+        self.assertGreaterEqual(summary['analysis_time'], 0.03)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_16_shared_analyzers_checks
+    def test_analyzers_are_closed_on_context_exit(self):
+        """
+        Ensure runs inside a context share analyzers closed on exit, also on errors
+        """
+        with self.assertRaises(ValueError):
+            with TextProcessingPipeline(CorpusManager(self.dataset.path)) as pipeline:
+                pipeline.run()
+                pipeline.run()
+                self.mystem.return_value.close.assert_not_called()
+                raise ValueError
+        self.assertEqual(1, self.mystem.call_count)
+        self.assertEqual(1, self.morph_analyzer.call_count)
+        self.assertEqual(6, self.mystem.return_value.analyze.call_count)
+        self.mystem.return_value.close.assert_called_once()
+        self.assertFalse(pipeline.analyzers.is_open)
+
+    def tearDown(self) -> None:
+        self.mystem_patch.stop()
+        self.morph_analyzer_patch.stop()
+        self.dataset.cleanup()
@@ -0,0 +1,77 @@
+"""
+Tests for columnar storage of tokens of a text
+"""
+import unittest
+
+import pytest
+
+from pipeline import MorphologicalToken, MorphologicalTokens, TokenVocabulary
+
+ANALYSES = [('Мама', 'мама', 'S,жен,од=им,ед', 'NOUN,anim,femn sing,nomn'),
+            ('мыла', 'мыть', 'V,несов,пе=прош,ед,изъяв,жен', 'VERB,impf,tran femn,sing,past'),
+            ('РАМУ', 'рама', 'S,жен,неод=вин,ед', 'NOUN,inan,femn sing,accs'),
+            ('мама', 'мама', 'S,жен,од=им,ед', 'NOUN,anim,femn sing,nomn')]
+
+
+def make_token(original_word, normalized_form, tags_mystem, tags_pymorphy):
+    """
+    Builds a single token the way it was stored before columns
+    """
+    token = MorphologicalToken(original_word)
+    token.normalized_form = normalized_form
+    token.tags_mystem = tags_mystem
+    token.tags_pymorphy = tags_pymorphy
+    return token
+
+
+class MorphologicalTokensTest(unittest.TestCase):
+    """
+    Tests for MorphologicalTokens realization
+    """
+
+    def setUp(self) -> None:
+        self.tokens = MorphologicalTokens(TokenVocabulary())
+        for analysis in ANALYSES:
+            self.tokens.append(*analysis)
+        self.expected = [make_token(*analysis) for analysis in ANALYSES]
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_17_morphological_tokens_checks
+    def test_columns_match_single_tokens(self):
+        """
+        Ensure text representations of columns match the ones of single tokens
+        """
+        self.assertEqual([token.get_cleaned() for token in self.expected],
+                         list(self.tokens.get_cleaned()))
+        self.assertEqual([token.get_single_tagged() for token in self.expected],
+                         list(self.tokens.get_single_tagged()))
+        self.assertEqual([token.get_multiple_tagged() for token in self.expected],
+                         list(self.tokens.get_multiple_tagged()))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_17_morphological_tokens_checks
+    def test_iteration_gives_single_tokens(self):
+        """
+        Ensure iterating over columns gives tokens with the same fields
+        """
+        self.assertEqual(len(ANALYSES), len(self.tokens))
+        for expected, token in zip(self.expected, self.tokens):
+            for field in MorphologicalToken.__slots__:
+                self.assertEqual(getattr(expected, field), getattr(token, field))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_17_morphological_tokens_checks
+    def test_words_are_read_between_appends(self):
+        """
+        Ensure words appended after a word was read are cut out of the buffer correctly
+        """
+        tokens = MorphologicalTokens(TokenVocabulary())
+        tokens.append(*ANALYSES[0])
+        self.assertEqual('Мама', tokens[0].original_word)
+        tokens.append(*ANALYSES[1])
+        tokens.append(*ANALYSES[2])
+        self.assertEqual('мыла', tokens[1].original_word)
+        tokens.append(*ANALYSES[3])
+        self.assertEqual(['мама', 'мыла', 'раму', 'мама'], list(tokens.get_cleaned()))
+        self.assertEqual([analysis[0] for analysis in ANALYSES],
+                         [token.original_word for token in tokens])
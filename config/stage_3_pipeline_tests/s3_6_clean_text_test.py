@@ -0,0 +1,53 @@
+"""
+Tests for text cleaning before morphological analysis
+"""
+import unittest
+
+import pytest
+
+from pipeline import clean_text, BATCH_SEPARATOR_MARK
+
+
+class CleanTextTest(unittest.TestCase):
+    """
+    Tests for clean_text realization
+    """
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_6_text_cleaning_checks
+    def test_all_non_letters_are_replaced(self):
+        """
+        Ensure every punctuation mark, digit and line break is removed,
+        not only the last one met in a text
+        """
+        raw_text = 'Красивая - мама красиво,\nмыла раму (2022) | ёлку!'
+        self.assertEqual('Красивая мама красиво мыла раму ёлку ',
+                         clean_text(raw_text))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_6_text_cleaning_checks
+    def test_letters_are_kept(self):
+        """
+        Ensure Russian and Latin letters of both cases are kept
+        """
+        raw_text = 'АаЯяЁё ZzAa'
+        self.assertEqual(raw_text, clean_text(raw_text))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_6_text_cleaning_checks
+    def test_cleaned_text_is_safe_for_batching(self):
+        """
+        Ensure cleaned text can be joined into one Mystem line
+        """
+        cleaned = clean_text(f'один\nдва {BATCH_SEPARATOR_MARK} три\r\n')
+        self.assertNotIn('\n', cleaned)
+        self.assertNotIn(BATCH_SEPARATOR_MARK, cleaned)
@@ -0,0 +1,54 @@
+"""
+Tests for ParseCache functionality
+"""
+import unittest
+
+import pytest
+
+from pipeline import ParseCache
+
+
+class ParseCacheTest(unittest.TestCase):
+    """
+    Tests for ParseCache realization
+    """
+
+    def setUp(self) -> None:
+        self.cache = ParseCache(max_size=2)
+        self.cache.put('мама', 'NOUN,anim,femn sing,nomn')
+        self.cache.put('мыла', 'VERB,impf,tran femn,sing,past,indc')
+
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_7_parse_cache_checks
+    def test_hits_and_misses_are_counted(self):
+        """
+        Ensure cache counts hits and misses
+        """
+        self.assertEqual('NOUN,anim,femn sing,nomn', self.cache.get('мама'))
+        self.assertIsNone(self.cache.get('раму'))
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_7_parse_cache_checks
+    def test_least_recently_used_word_is_evicted(self):
+        """
+        Ensure cache does not grow over its size and keeps recently used words
+        """
+        self.cache.get('мама')
+        self.cache.put('раму', 'NOUN,inan,femn sing,accs')
+        self.assertEqual(2, len(self.cache))
+        self.assertIsNone(self.cache.get('мыла'))
+        self.assertIsNotNone(self.cache.get('мама'))
+
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_7_parse_cache_checks
+    def test_zero_size_disables_cache(self):
+        """
+        Ensure cache of zero size stores nothing
+        """
+        cache = ParseCache(max_size=0)
+        cache.put('мама', 'NOUN,anim,femn sing,nomn')
+        self.assertEqual(0, len(cache))
@@ -0,0 +1,79 @@
+"""
+Tests for sharded dataset layout and configurable number of articles
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from core_utils.article import Article
+from pipeline import CorpusManager, validate_dataset
+from scrapper import NumberOfArticlesOutOfRangeError, validate_config
+
+
+class ShardedDatasetTest(unittest.TestCase):
+    """
+    Tests for reading and writing articles in sharded layout
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset(shard_size=2)
+        self.assets_path = self.dataset.path
+        for article_id in range(1, 6):
+            self.dataset.add_article(article_id, f'Текст статьи {article_id}')
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_8_sharded_dataset_checks
+    def test_articles_are_saved_in_shards(self):
+        """
+        Ensure each shard folder holds a range of ids
+        """
+        shards = sorted(path.name for path in self.assets_path.iterdir())
+        self.assertEqual(['0000001-0000002', '0000003-0000004', '0000005-0000006'], shards)
+        self.assertTrue((self.assets_path / '0000003-0000004' / '4_raw.txt').exists())
+        self.assertEqual(self.assets_path / '0000005-0000006' / '5_cleaned.txt',
+                         Article(None, 5).get_file_path('cleaned'))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_8_sharded_dataset_checks
+    def test_sharded_dataset_is_read(self):
+        """
+        Ensure corpus manager and dataset validation understand sharded layout
+        """
+        validate_dataset(self.assets_path)
+        articles = CorpusManager(self.assets_path).get_articles()
+        self.assertEqual([1, 2, 3, 4, 5], sorted(articles))
+        self.assertEqual('Текст статьи 3', articles[3].get_raw_text())
+
+    def tearDown(self) -> None:
+        self.dataset.cleanup()
+
+
+class ArticlesLimitTest(unittest.TestCase):
+    """
+    Tests for configurable upper limit of articles
+    """
+
+    @staticmethod
+    def _validate(config: dict):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = Path(directory) / 'scrapper_config.json'
+            with open(config_path, 'w', encoding='utf-8') as file:
+                json.dump(config, file)
+            return validate_config(config_path)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_8_sharded_dataset_checks
+    def test_limit_is_taken_from_config(self):
+        """
+        Ensure the default limit applies unless the config raises it
+        """
+        config = {'seed_urls': ['https://www.nn.ru/text/'],
+                  'total_articles_to_find_and_parse': 50000}
+        with self.assertRaises(NumberOfArticlesOutOfRangeError):
+            self._validate(config)
+        config['max_articles'] = 100000
+        self.assertEqual(50000, self._validate(config)[1])
@@ -0,0 +1,122 @@
+"""
+Tests for dataset index and lazy loading of article metadata
+"""
+import datetime
+import json
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from core_utils.article import Article
+from core_utils.dataset_index import DatasetIndex
+from pipeline import CorpusManager
+
+
+class DatasetIndexTest(unittest.TestCase):
+    """
+    Tests for DatasetIndex and its use by Article and CorpusManager
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        self.assets_path = self.dataset.path
+        self.index = DatasetIndex(self.assets_path)
+        self.index.reset()
+        for article_id in range(1, 4):
+            self.dataset.add_article(article_id, f'Текст статьи {article_id}',
+                                     datetime.datetime(2022, 4, 28, 18, 1),
+                                     title=f'Статья {article_id}')
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_meta_is_loaded_on_first_access(self):
+        """
+        Ensure creating an article does not read its meta file
+        """
+        with mock.patch('core_utils.article.json.load', wraps=json.load) as load:
+            article = Article(None, 2)
+            load.assert_not_called()
+            self.assertEqual('Статья 2', article.title)
+            self.assertEqual('https://www.nn.ru/text/2/', article.url)
+            self.assertEqual(datetime.datetime(2022, 4, 28, 18, 1), article.date)
+            load.assert_called_once()
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_up_to_date_index_replaces_scanning(self):
+        """
+        Ensure corpus manager reads files and metadata from the index only,
+        also after the index is rebuilt
+        """
+        # a coarse file system clock may give the folder and the index equal mtimes
+        time.sleep(0.05)
+        self.index.rebuild()
+        with mock.patch('core_utils.dataset_index.os.scandir', side_effect=AssertionError), \
+                mock.patch('core_utils.article.json.load', side_effect=AssertionError):
+            corpus_manager = CorpusManager(self.assets_path)
+            corpus_manager.load_meta()
+        articles = corpus_manager.get_articles()
+        self.assertEqual([1, 2, 3], sorted(articles))
+        self.assertEqual('Статья 3', articles[3].title)
+        self.assertEqual(datetime.datetime(2022, 4, 28, 18, 1), articles[3].date)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_stale_index_is_rebuilt(self):
+        """
+        Ensure files removed behind the index are noticed by a single scan
+        """
+        (self.assets_path / '2_raw.txt').unlink()
+        (self.assets_path / '2_meta.json').unlink()
+        corpus_manager = CorpusManager(self.assets_path)
+        self.assertEqual([1, 3], sorted(corpus_manager.get_articles()))
+        corpus_manager.load_meta()
+        self.assertEqual('Статья 3', corpus_manager.get_articles()[3].title)
+        self.assertEqual(['1_meta.json', '1_raw.txt', '3_meta.json', '3_raw.txt'],
+                         sorted(self.index.get_entries()))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_rewritten_meta_file_is_read(self):
+        """
+        Ensure bulk and lazy loading agree after a meta file is rewritten in place
+        """
+        time.sleep(0.05)
+        self.index.rebuild()
+        meta_path = self.assets_path / '1_meta.json'
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        meta['title'] = 'Новый заголовок'
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+        corpus_manager = CorpusManager(self.assets_path)
+        corpus_manager.load_meta()
+        self.assertEqual('Новый заголовок', corpus_manager.get_articles()[1].title)
+        self.assertEqual('Новый заголовок', Article(None, 1).title)
+        self.assertEqual('Статья 2', corpus_manager.get_articles()[2].title)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_index_is_not_started_by_writes(self):
+        """
+        Ensure articles written without an index do not create a partial one
+        """
+        self.index.path.unlink()
+        Article(None, 4).save_as('текст', 'cleaned')
+        self.assertFalse(self.index.path.exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_9_dataset_index_checks
+    def test_index_is_not_started_by_reading(self):
+        """
+        Ensure reading a folder without an index scans it without writing one
+        """
+        self.index.path.unlink()
+        corpus_manager = CorpusManager(self.assets_path)
+        corpus_manager.load_meta()
+        self.assertEqual('Статья 3', corpus_manager.get_articles()[3].title)
+        self.assertEqual([self.assets_path], list(self.assets_path.parent.iterdir()))
+
+    def tearDown(self) -> None:
+        self.dataset.cleanup()
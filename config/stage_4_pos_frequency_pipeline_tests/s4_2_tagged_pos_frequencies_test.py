@@ -0,0 +1,81 @@
+"""
+Tests for POS frequencies counted from tagged artifacts
+"""
+import json
+import unittest
+from unittest import mock
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from core_utils.article import ArtifactType
+from pipeline import CorpusManager
+from pos_frequency_pipeline import (EmptyFileError, POSFrequencyPipeline,
+                                    count_pos_frequencies)
+
+
+SINGLE_TAGGED = 'красивый<A=им,ед,полн,жен> мама<S,жен,од=им,ед> красиво<ADV=> ' \
+                'мыть<V,несов,пе=прош,ед,изъяв,жен> рама<S,жен,неод=вин,ед> ' \
+                'в<PR=> второй<ANUM=пр,ед,жен> река<S,жен,неод=пр,ед>'
+FREQUENCIES = {'S': 3, 'A': 1, 'ADV': 1, 'V': 1, 'PR': 1, 'ANUM': 1}
+
+
+class TaggedPOSFrequenciesTest(unittest.TestCase):
+    """
+    Tests for POSFrequencyPipeline working on single-tagged files
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        self.assets_path = self.dataset.path
+        for article_id in (1, 2):
+            article = self.dataset.add_article(
+                article_id, 'Красивая - мама красиво, мыла раму во второй реке.')
+            article.save_as(SINGLE_TAGGED, ArtifactType.single_tagged)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_2_tagged_pos_frequencies_checks
+    def test_frequencies_are_counted_across_blocks(self):
+        """
+        Ensure tokens cut by a read block are counted once
+        """
+        path = self.assets_path / '1_single_tagged.txt'
+        with mock.patch('pos_frequency_pipeline.READ_BUFFER_SIZE', 7):
+            self.assertEqual(FREQUENCIES, count_pos_frequencies(path))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_2_tagged_pos_frequencies_checks
+    def test_frequencies_are_saved_to_meta(self):
+        """
+        Ensure frequencies are saved with the rest of the meta and drawn
+        """
+        POSFrequencyPipeline(CorpusManager(self.assets_path), workers=2).run()
+        for article_id in (1, 2):
+            with open(self.assets_path / f'{article_id}_meta.json', encoding='utf-8') as file:
+                meta = json.load(file)
+            self.assertEqual(FREQUENCIES, meta['pos_frequencies'])
+            self.assertEqual('NOT FOUND', meta['author'])
+            self.assertTrue((self.assets_path / f'{article_id}_image.png').is_file())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_2_tagged_pos_frequencies_checks
+    def test_morphology_is_not_run(self):
+        """
+        Ensure parts of speech are taken from tags without calling Mystem
+        """
+        with mock.patch('pymystem3.Mystem.analyze') as analyze:
+            POSFrequencyPipeline(CorpusManager(self.assets_path)).run()
+        analyze.assert_not_called()
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_2_tagged_pos_frequencies_checks
+    def test_empty_file_raises(self):
+        """
+        Ensure an empty single-tagged file is reported
+        """
+        (self.assets_path / '2_single_tagged.txt').write_text('', encoding='utf-8')
+        with self.assertRaises(EmptyFileError):
+            POSFrequencyPipeline(CorpusManager(self.assets_path), workers=2).run()
+
+    def tearDown(self) -> None:
+        self.dataset.cleanup()
@@ -0,0 +1,56 @@
+"""
+Tests for batch rendering of POS frequency charts
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pytest
+
+from core_utils.visualizer import ChartRenderer, visualize, visualize_batch
+
+
+PNG_SIGNATURE = b'\x89PNG'
+
+
+class ChartRendererTest(unittest.TestCase):
+    """
+    Tests for rendering many charts on a reused figure
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.charts = [({'S': article_id + 3, 'V': 2, 'A': 1}, self.path / f'{article_id}_image.png')
+                       for article_id in range(1, 7)]
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_3_chart_renderer_checks
+    def test_charts_are_rendered_in_workers(self):
+        """
+        Ensure every chart of a batch is saved when rendering across processes
+        """
+        visualize_batch(self.charts, workers=2)
+        for _, path in self.charts:
+            self.assertEqual(PNG_SIGNATURE, path.read_bytes()[:4])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_3_chart_renderer_checks
+    def test_figure_is_reused(self):
+        """
+        Ensure charts are drawn with one vectorized call on the same figure
+        and no pyplot figures are left open
+        """
+        renderer = ChartRenderer()
+        for statistics, path in self.charts:
+            renderer.render(statistics, path)
+            self.assertEqual(1, len(renderer.axis.containers))
+            self.assertEqual(3, len(renderer.axis.patches))
+        self.assertEqual(1, len(renderer.figure.axes))
+        visualize({}, self.path / 'empty_image.png')
+        self.assertEqual([], plt.get_fignums())
+        self.assertTrue((self.path / 'empty_image.png').is_file())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
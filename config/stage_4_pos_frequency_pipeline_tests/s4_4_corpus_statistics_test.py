@@ -0,0 +1,86 @@
+"""
+Tests for corpus-wide statistics
+"""
+import datetime
+import unittest
+
+import pytest
+
+from config.test_params import TemporaryDataset
+from core_utils.article import ArtifactType
+from corpus_statistics import CorpusStatistics
+from pipeline import CorpusManager
+
+
+class CorpusStatisticsTest(unittest.TestCase):
+    """
+    Tests for frequency matrices of the whole corpus
+    """
+
+    def setUp(self) -> None:
+        self.dataset = TemporaryDataset()
+        self.assets_path = self.dataset.path
+        self.add_article(1, datetime.datetime(2022, 4, 1), ['Город'],
+                         'мама<S,жен,од=им,ед> мыть<V,несов,пе=прош,ед,изъяв,жен> '
+                         'рама<S,жен,неод=вин,ед> мама<S,жен,од=им,ед>')
+        self.add_article(2, datetime.datetime(2022, 4, 20), ['Транспорт'],
+                         'метро<S,сред,неод=им,ед> продлять<V,сов,пе=непрош,мн,изъяв,3-л>')
+        # counted by the pipeline, the single-tagged file is not read
+        article = self.add_article(3, datetime.datetime(2022, 5, 2), ['Город', 'Транспорт'],
+                                   'не<PART=>')
+        article.lemma_frequencies = {'мама': 1, 'метро': 3}
+        article.pos_frequencies = {'S': 4}
+        article.save_meta()
+        self.statistics = CorpusStatistics(CorpusManager(self.assets_path))
+        self.statistics.update()
+
+    def add_article(self, article_id, date, topics, single_tagged):
+        """
+        Saves a processed article
+        """
+        article = self.dataset.add_article(article_id, date=date, topics=topics)
+        article.save_as(single_tagged, ArtifactType.single_tagged)
+        return article
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_4_corpus_statistics_checks
+    def test_corpus_frequencies(self):
+        """
+        Ensure corpus frequencies and document frequencies are counted
+        """
+        self.assertEqual({'мама': 3, 'метро': 4}, self.statistics.get_top_lemmas(2))
+        self.assertEqual({'S': 8, 'V': 2}, self.statistics.get_pos_frequencies())
+        self.assertEqual({'мама': 2, 'мыть': 1, 'рама': 1, 'метро': 2, 'продлять': 1},
+                         self.statistics.get_document_frequencies())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_4_corpus_statistics_checks
+    def test_queries_by_topic_and_date(self):
+        """
+        Ensure articles are selected by topic and date range
+        """
+        self.assertEqual({'метро': 4, 'мама': 1, 'продлять': 1},
+                         self.statistics.get_top_lemmas(topic='Транспорт'))
+        self.assertEqual({'мама': 2, 'мыть': 1, 'рама': 1},
+                         self.statistics.get_top_lemmas(topic='Город',
+                                                        end=datetime.datetime(2022, 5, 1)))
+        self.assertEqual({'S': 5, 'V': 1},
+                         self.statistics.get_pos_frequencies(start='2022-04-20'))
+        self.assertEqual({}, self.statistics.get_top_lemmas(topic='Спорт'))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_4_4_corpus_statistics_checks
+    def test_new_articles_are_added_incrementally(self):
+        """
+        Ensure only new articles are counted on update and new lemmas get columns
+        """
+        self.add_article(4, datetime.datetime(2022, 5, 3), ['Город'], 'сквер<S,муж,неод=им,ед>')
+        (self.assets_path / '5_raw.txt').write_text('Текст', encoding='utf-8')
+        self.assertEqual(1, self.statistics.update(CorpusManager(self.assets_path)))
+        self.assertEqual([1, 2, 3, 4], self.statistics.article_ids)
+        self.assertEqual((4, 6), self.statistics.lemmas.counts.shape)
+        self.assertEqual({'метро': 3, 'мама': 1, 'сквер': 1},
+                         self.statistics.get_top_lemmas(topic='Город', start='2022-05-01'))
+
+    def tearDown(self) -> None:
+        self.dataset.cleanup()
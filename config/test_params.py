@@ -1,7 +1,12 @@
 """
 Parameters for testing
 """
+import datetime
+import tempfile
 from pathlib import Path
+from unittest import mock
+
+from core_utils.article import Article
 
 PROJECT_ROOT = Path(__file__).parent
 
@@ -14,3 +19,44 @@ TEST_SCRAPPER_CONFIG = 'scrapper_config_test.json'
 TEST_CRAWLER_CONFIG_PATH = TEST_PATH / TEST_SCRAPPER_CONFIG
 
 TEST_FILES_FOLDER = PROJECT_ROOT / 'test_files'
+
+
+class TemporaryDataset:
+    """
+    Dataset folder in a temporary directory that replaces ASSETS_PATH
+    until it is cleaned up
+    """
+
+    def __init__(self, shard_size: int = None):
+        self.directory = tempfile.TemporaryDirectory()
+        # the dataset index is kept next to the folder, inside the temporary directory
+        self.path = Path(self.directory.name) / 'articles'
+        self.path.mkdir()
+        self._patches = [mock.patch('core_utils.article.ASSETS_PATH', self.path)]
+        if shard_size is not None:
+            self._patches.append(mock.patch('core_utils.article.ASSETS_SHARD_SIZE', shard_size))
+        for patch in self._patches:
+            patch.start()
+
+    @staticmethod
+    def add_article(article_id: int, text: str = 'Текст',
+                    date: datetime.datetime = datetime.datetime(2022, 4, 28), **meta) -> Article:
+        """
+        Saves a raw text and meta file of an article, other meta fields may be given
+        """
+        article = Article(f'https://www.nn.ru/text/{article_id}/', article_id)
+        article.author = 'NOT FOUND'
+        article.date = date
+        for name, value in meta.items():
+            setattr(article, name, value)
+        article.text = text
+        article.save_raw()
+        return article
+
+    def cleanup(self):
+        """
+        Restores ASSETS_PATH and removes the temporary directory
+        """
+        for patch in self._patches:
+            patch.stop()
+        self.directory.cleanup()
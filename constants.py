@@ -6,8 +6,16 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent
 ASSETS_PATH = PROJECT_ROOT / 'tmp' / 'articles'
+MORPHOLOGY_CACHE_PATH = ASSETS_PATH.parent / 'morphology_cache.sqlite'
+PIPELINE_MANIFEST_PATH = ASSETS_PATH.parent / 'pipeline_manifest.json'
+CRAWL_CHECKPOINT_PATH = ASSETS_PATH.parent / 'crawl_checkpoint.json'
+HTTP_CACHE_PATH = ASSETS_PATH.parent / 'http_cache'
 CRAWLER_CONFIG_PATH = PROJECT_ROOT / 'scrapper_config.json'
+MAX_ARTICLES = 200
+ASSETS_SHARD_SIZE = 0
 HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
                          'Chrome/100.0.4896.127 Safari/537.36',
            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml, image/*,*/*;q=0.8'}
 HTTP_PATTERN = 'https://www.nn.ru'
+LISTING_URL_PATTERN = HTTP_PATTERN + '/text/?page={page}'
+MAX_LISTING_PAGES = 100
@@ -3,8 +3,15 @@ Article implementation
 """
 import json
 import datetime
+import hashlib
+import os
+from contextlib import ExitStack
+from pathlib import Path
 
-from constants import ASSETS_PATH
+from constants import ASSETS_PATH, ASSETS_SHARD_SIZE
+from core_utils.dataset_index import DatasetIndex
+
+WRITE_BUFFER_SIZE = 2 ** 20
 
 
 class ArtifactType:
@@ -20,39 +27,148 @@ def date_from_meta(date_txt):
     return datetime.datetime.strptime(date_txt, "%Y-%m-%d %H:%M:%S")
 
 
+def get_article_directory(article_id: int) -> Path:
+    """
+    Returns a folder of an article: ASSETS_PATH itself in flat layout
+    or its subfolder for a range of ASSETS_SHARD_SIZE ids in sharded layout
+    """
+    if ASSETS_SHARD_SIZE <= 0:
+        return ASSETS_PATH
+    first_id = (int(article_id) - 1) // ASSETS_SHARD_SIZE * ASSETS_SHARD_SIZE + 1
+    return ASSETS_PATH / f'{first_id:07d}-{first_id + ASSETS_SHARD_SIZE - 1:07d}'
+
+
+def iter_dataset_files(path):
+    """
+    Yields files of a dataset stored in flat or sharded layout
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                with os.scandir(entry.path) as shard_entries:
+                    yield from (shard_entry for shard_entry in shard_entries
+                                if shard_entry.is_file())
+            elif entry.is_file():
+                yield entry
+
+
+class MetaField:
+    """
+    Article attribute that is read from a meta file on first access
+    """
+
+    def __init__(self):
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = f'_{name}'
+
+    def __get__(self, article, owner=None):
+        if article is None:
+            return self
+        article.load_meta()
+        return getattr(article, self.name)
+
+    def __set__(self, article, value):
+        article.load_meta()
+        setattr(article, self.name, value)
+
+
 class Article:
     """
     Article class implementation.
-    Stores article metadata and knows how to work with articles
+    Stores article metadata and knows how to work with articles.
+    Metadata is read from a meta file only when it is first needed
     """
+    # pylint: disable=too-many-instance-attributes
+    url = MetaField()
+    title = MetaField()
+    author = MetaField()
+    topics = MetaField()
+    pos_frequencies = MetaField()
+    lemma_frequencies = MetaField()
 
     def __init__(self, url, article_id):
-        self.url = url
         self.article_id = article_id
 
-        self.title = ''
-        self.date = None
-        self.author = ''
-        self.topics = []
+        self._meta_loaded = False
+        self._url = url
+        self._title = ''
+        self._date = None
+        self._date_text = None
+        self._author = ''
+        self._topics = []
+        self._pos_frequencies = None
+        self._lemma_frequencies = None
         self.text = ''
 
-        meta_file = self.get_meta_file_path()
-        if meta_file.exists():
-            self.from_meta_json(meta_file)
+    @property
+    def date(self):
+        """
+        Article date, parsed from its text on first access
+        """
+        self.load_meta()
+        if self._date_text is not None:
+            self._date = date_from_meta(self._date_text)
+            self._date_text = None
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        self.load_meta()
+        self._date = value
+        self._date_text = None
 
     def save_raw(self):
         """
         Saves raw text and article meta data
         """
-        article_meta_name = "{}_meta.json".format(self.article_id)
+        raw_text_path = self.get_raw_text_path()
+        raw_text_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.get_raw_text_path(), 'w', encoding='utf-8') as file:
+        with open(raw_text_path, 'w', encoding='utf-8') as file:
             file.write(self.text)
+        self._record(raw_text_path, hash=hashlib.sha256(self.text.encode('utf-8')).hexdigest())
 
         if self.author:
-            with (ASSETS_PATH / article_meta_name).open("w", encoding='utf-8') as file:
-                json.dump(self._get_meta(), file, sort_keys=False,
-                          indent=4, ensure_ascii=False, separators=(',', ': '))
+            self.save_meta()
+
+    def save_meta(self):
+        """
+        Saves article meta data
+        """
+        meta = self._get_meta()
+        with self.get_meta_file_path().open("w", encoding='utf-8') as file:
+            json.dump(meta, file, sort_keys=False,
+                      indent=4, ensure_ascii=False, separators=(',', ': '))
+        self._record(self.get_meta_file_path(), meta=meta)
+
+    def load_meta(self):
+        """
+        Reads the meta file of the article unless metadata is already known
+        """
+        if self._meta_loaded:
+            return
+        self._meta_loaded = True
+        meta_file = self.get_meta_file_path()
+        if meta_file.exists():
+            with open(meta_file, encoding='utf-8') as file:
+                self.set_meta(json.load(file))
+
+    def set_meta(self, meta: dict):
+        """
+        Fills metadata of the article from a dictionary read from a meta file,
+        the date is parsed only when it is needed
+        """
+        self._meta_loaded = True
+        self._url = meta.get('url', None)
+        self._title = meta.get('title', '')
+        self._date = None
+        self._date_text = meta.get('date', None)
+        self._author = meta.get('author', None)
+        self._topics = meta.get('topics', None)
+        self._pos_frequencies = meta.get('pos_frequencies', None)
+        self._lemma_frequencies = meta.get('lemma_frequencies', None)
 
     def from_meta_json(self, json_path: str):
         """
@@ -61,11 +177,8 @@ class Article:
         with open(json_path, encoding='utf-8') as meta_file:
             meta = json.load(meta_file)
 
-        self.url = meta.get('url', None)
-        self.title = meta.get('title', '')
+        self.set_meta(meta)
         self.date = date_from_meta(meta.get('date', None))
-        self.author = meta.get('author', None)
-        self.topics = meta.get('topics', None)
 
         # intentionally leave it empty
         self.text = None
@@ -85,12 +198,43 @@ class Article:
         """
         with open(self.get_file_path(kind), 'w', encoding='utf-8') as file:
             file.write(text)
+        self._record(self.get_file_path(kind))
+
+    def save_tokens(self, tokens) -> None:
+        """
+        Streams tokens into cleaned, single-tagged and multiple-tagged files
+        in a single pass, so that joined texts are never built in memory
+        tokens: an iterable of objects with get_cleaned, get_single_tagged
+        and get_multiple_tagged methods
+        """
+        with ExitStack() as stack:
+            cleaned, single_tagged, multiple_tagged = (
+                stack.enter_context(open(self.get_file_path(kind), 'w', encoding='utf-8',
+                                         buffering=WRITE_BUFFER_SIZE))
+                for kind in (ArtifactType.cleaned,
+                             ArtifactType.single_tagged,
+                             ArtifactType.multiple_tagged))
+            separator = ''
+            for token in tokens:
+                cleaned.write(f'{separator}{token.get_cleaned()}')
+                single_tagged.write(f'{separator}{token.get_single_tagged()}')
+                multiple_tagged.write(f'{separator}{token.get_multiple_tagged()}')
+                separator = ' '
+        for kind in (ArtifactType.cleaned, ArtifactType.single_tagged, ArtifactType.multiple_tagged):
+            self._record(self.get_file_path(kind))
+
+    @staticmethod
+    def _record(file_path, **fields):
+        """
+        Records a written file in the dataset index
+        """
+        DatasetIndex(ASSETS_PATH).record(file_path, **fields)
 
     def _get_meta(self):
         """
         Gets all article params
         """
-        return {
+        meta = {
             'id': self.article_id,
             'url': self.url,
             'title': self.title,
@@ -98,6 +242,11 @@ class Article:
             'author': self.author,
             'topics': self.topics
         }
+        if self.pos_frequencies is not None:
+            meta['pos_frequencies'] = self.pos_frequencies
+        if self.lemma_frequencies is not None:
+            meta['lemma_frequencies'] = self.lemma_frequencies
+        return meta
 
     def _date_to_text(self):
         """
@@ -110,14 +259,21 @@ class Article:
         Returns path for requested raw article
         """
         article_txt_name = "{}_raw.txt".format(self.article_id)
-        return ASSETS_PATH / article_txt_name
+        return get_article_directory(self.article_id) / article_txt_name
 
     def get_meta_file_path(self):
         """
         Returns path for requested raw article
         """
         meta_file_name = "{}_meta.json".format(self.article_id)
-        return ASSETS_PATH / meta_file_name
+        return get_article_directory(self.article_id) / meta_file_name
+
+    def get_image_path(self):
+        """
+        Returns path for a chart of the article POS frequencies
+        """
+        image_name = "{}_image.png".format(self.article_id)
+        return get_article_directory(self.article_id) / image_name
 
     def get_file_path(self, kind: str) -> str:
         """
@@ -138,4 +294,4 @@ class Article:
 
         article_txt_name = "{}_{}.txt".format(self.article_id, kind)
 
-        return ASSETS_PATH / article_txt_name
+        return get_article_directory(self.article_id) / article_txt_name
@@ -0,0 +1,151 @@
+"""
+Index of dataset files
+"""
+import json
+import os
+from pathlib import Path
+
+
+class DatasetIndex:
+    """
+    Journal of dataset files kept next to the dataset folder.
+    Every article write appends a record with a size, mtime and,
+    for raw texts and meta files, a hash or meta fields.
+    The index is stale once the folder or its shards change behind its back.
+    An index is started only for a fresh dataset folder, a folder without one
+    is scanned on every read and nothing is written next to it
+    """
+
+    def __init__(self, assets_path):
+        self.assets_path = Path(assets_path)
+        self.path = self.assets_path.parent / f'{self.assets_path.name}_index.jsonl'
+
+    def record(self, file_path, **fields):
+        """
+        Appends a record of a written file, does nothing if there is no index yet
+        """
+        if not self.path.exists():
+            return
+        stat = os.stat(file_path)
+        entry = {'file': Path(file_path).relative_to(self.assets_path).as_posix(),
+                 'size': stat.st_size,
+                 'mtime': stat.st_mtime_ns,
+                 **fields}
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def get_entries(self) -> dict:
+        """
+        Returns records of dataset files by their paths relative to the dataset folder,
+        rebuilds the index if it is stale and scans the folder if there is no index
+        """
+        entries = self._load()
+        if entries is not None:
+            return entries
+        if self.path.exists():
+            return self.rebuild()
+        return self._scan({})
+
+    def is_current(self, entry: dict) -> bool:
+        """
+        Tells whether a recorded file still has the recorded size and mtime
+        """
+        try:
+            stat = os.stat(self.assets_path / entry['file'])
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (entry['size'], entry['mtime'])
+
+    def rebuild(self) -> dict:
+        """
+        Scans the dataset folder and its shards once and rewrites the index,
+        records of files that have not changed since they were written are kept
+        """
+        journal = self._read()
+        entries = self._scan(journal[2] if journal is not None else {})
+        self._write(entries)
+        return entries
+
+    def reset(self):
+        """
+        Starts an empty index for an empty dataset folder
+        """
+        self._write({})
+
+    def _scan(self, recorded):
+        """
+        Scans the dataset folder and its shards once,
+        records of files that have not changed since they were written are kept
+        """
+        entries = {}
+        with os.scandir(self.assets_path) as folder_entries:
+            for folder_entry in folder_entries:
+                if folder_entry.is_dir():
+                    with os.scandir(folder_entry.path) as shard_entries:
+                        for shard_entry in shard_entries:
+                            if shard_entry.is_file():
+                                self._add_scanned(entries, recorded, shard_entry,
+                                                  f'{folder_entry.name}/{shard_entry.name}')
+                elif folder_entry.is_file():
+                    self._add_scanned(entries, recorded, folder_entry, folder_entry.name)
+        return entries
+
+    @staticmethod
+    def _add_scanned(entries, recorded, dir_entry, relative_path):
+        stat = dir_entry.stat()
+        entry = {'file': relative_path, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+        previous = recorded.get(relative_path, {})
+        if (previous.get('size'), previous.get('mtime')) == (entry['size'], entry['mtime']):
+            entry = previous
+        entries[relative_path] = entry
+
+    def _get_folder_id(self):
+        stat = os.stat(self.assets_path)
+        return [stat.st_dev, stat.st_ino]
+
+    def _read(self):
+        """
+        Reads the journal, returns its mtime, number of records and latest records of files
+        or None if there is no readable journal of this folder
+        """
+        try:
+            index_mtime = os.stat(self.path).st_mtime_ns
+            with open(self.path, encoding='utf-8') as file:
+                header = json.loads(file.readline())
+                records = json.loads(f"[{','.join(file.read().splitlines())}]")
+        except (FileNotFoundError, ValueError):
+            return None
+        if header.get('folder') != self._get_folder_id():
+            return None
+        return index_mtime, len(records), {record['file']: record for record in records}
+
+    def _load(self):
+        """
+        Reads the journal, returns None if it is missing or stale
+        """
+        journal = self._read()
+        if journal is None:
+            return None
+        index_mtime, number_of_records, entries = journal
+        folders = {relative_path.rpartition('/')[0] for relative_path in entries} | {''}
+        for folder in folders:
+            try:
+                if os.stat(self.assets_path / folder).st_mtime_ns >= index_mtime:
+                    return None
+            except FileNotFoundError:
+                return None
+
+        if number_of_records > 2 * len(entries):
+            self._write(entries)
+        return entries
+
+    def _write(self, entries):
+        """
+        Replaces the journal with a compact one
+        """
+        temporary_path = self.path.with_suffix('.tmp')
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({'folder': self._get_folder_id()}) + '\n')
+            for entry in entries.values():
+                file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        temporary_path.replace(self.path)
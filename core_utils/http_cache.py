@@ -0,0 +1,124 @@
+"""
+On-disk cache of HTTP responses
+"""
+import hashlib
+import io
+import json
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheMissError(requests.RequestException):
+    """
+    Requested page is not in the cache while working offline,
+    the page is treated as failed like on a network error
+    """
+
+
+class HTTPResponseCache:
+    """
+    Stores downloaded pages with their validators keyed by URL,
+    along with fields parsed from the pages
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _get_paths(self, url: str):
+        """
+        Returns paths of an entry description and a page body
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.path / f'{key}.json', self.path / f'{key}.html'
+
+    def load(self, url: str):
+        """
+        Returns a description of a cached page or None
+        """
+        entry_path, body_path = self._get_paths(url)
+        if not entry_path.exists() or not body_path.exists():
+            return None
+        with open(entry_path, encoding='utf-8') as file:
+            return json.load(file)
+
+    def get_validators(self, url: str) -> dict:
+        """
+        Returns headers that make a request for a cached page conditional
+        """
+        entry = self.load(url)
+        if entry is None:
+            return {}
+        validators = {}
+        if entry['etag']:
+            validators['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            validators['If-Modified-Since'] = entry['last_modified']
+        return validators
+
+    def build_response(self, url: str):
+        """
+        Returns a cached page as a response or None
+        """
+        entry = self.load(url)
+        if entry is None:
+            return None
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry['status_code']
+        response.encoding = entry['encoding']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.raw = io.BytesIO(self._get_paths(url)[1].read_bytes())
+        return response
+
+    def store(self, url: str, response: requests.Response):
+        """
+        Saves a downloaded page, fields parsed from a page are kept if the page is unchanged
+        """
+        entry_path, body_path = self._get_paths(url)
+        previous = self.load(url) or {}
+        entry = {
+            'url': url,
+            'status_code': response.status_code,
+            'encoding': response.encoding,
+            'headers': dict(response.headers),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': hashlib.sha256(response.content).hexdigest(),
+            'parsed': previous.get('parsed')
+        }
+        self._write(body_path, response.content)
+        self._write(entry_path, json.dumps(entry, ensure_ascii=False, indent=4).encode('utf-8'))
+
+    def load_parsed(self, url: str):
+        """
+        Returns fields parsed from the current version of a cached page or None
+        """
+        entry = self.load(url)
+        if entry is None or entry['parsed'] is None:
+            return None
+        if entry['parsed']['body_hash'] != entry['body_hash']:
+            return None
+        return entry['parsed']['fields']
+
+    def store_parsed(self, url: str, fields: dict):
+        """
+        Saves fields parsed from the current version of a cached page
+        """
+        entry = self.load(url)
+        if entry is None:
+            return
+        entry['parsed'] = {'body_hash': entry['body_hash'], 'fields': fields}
+        self._write(self._get_paths(url)[0],
+                    json.dumps(entry, ensure_ascii=False, indent=4).encode('utf-8'))
+
+    @staticmethod
+    def _write(path: Path, content: bytes):
+        """
+        Replaces a file atomically
+        """
+        temporary_path = path.with_suffix(path.suffix + '.tmp')
+        temporary_path.write_bytes(content)
+        temporary_path.replace(path)
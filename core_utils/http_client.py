@@ -0,0 +1,257 @@
+"""
+HTTP client shared by the crawler and parsers
+"""
+import datetime
+from email.utils import parsedate_to_datetime
+import threading
+from time import monotonic, perf_counter, sleep
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import HEADERS
+from core_utils.http_cache import CacheMissError, HTTPResponseCache
+
+
+PUSHBACK_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """
+    Token bucket of one host kept as the time its next token is due
+    """
+    __slots__ = ('requests_per_second', 'next_token_time', 'pushbacks')
+
+    def __init__(self, requests_per_second: float):
+        self.requests_per_second = requests_per_second
+        self.next_token_time = 0.0
+        self.pushbacks = 0
+
+
+class PolitenessScheduler:
+    """
+    Spaces out requests to each host with a token bucket:
+    the rate is halved and the host is paused when the server pushes back
+    with 429 or 503 (for as long as Retry-After asks, if it does),
+    and the rate grows back to the budget while responses are successful
+    """
+
+    def __init__(self, requests_per_second: float = None, burst: int = 1,
+                 min_requests_per_second: float = 0.05, max_pause: float = 300.0):
+        self._requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_requests_per_second = min_requests_per_second
+        self.max_pause = max_pause
+        self.waiting_time = 0.0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_second(self):
+        """
+        Budget of requests per second to each host, None means no budget
+        """
+        return self._requests_per_second
+
+    @requests_per_second.setter
+    def requests_per_second(self, value: float):
+        with self._lock:
+            self._requests_per_second = value
+            self._buckets.clear()
+
+    def _get_bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self._requests_per_second)
+        return self._buckets[host]
+
+    def get_rate(self, url: str):
+        """
+        Returns the current rate of requests to the host of a given URL
+        """
+        with self._lock:
+            return self._get_bucket(url).requests_per_second
+
+    def reserve(self, url: str) -> float:
+        """
+        Takes a token for the host of a given URL and returns how many seconds are left until it
+        """
+        with self._lock:
+            bucket = self._get_bucket(url)
+            now = monotonic()
+            interval = 1 / bucket.requests_per_second if bucket.requests_per_second else 0.0
+            bucket.next_token_time = max(bucket.next_token_time, now - (self.burst - 1) * interval)
+            delay = max(0.0, bucket.next_token_time - now)
+            bucket.next_token_time += interval
+            self.waiting_time += delay
+        return delay
+
+    def acquire(self, url: str):
+        """
+        Blocks a calling thread until a request to the host of a given URL is allowed
+        """
+        sleep(self.reserve(url))
+
+    def report(self, url: str, response: requests.Response):
+        """
+        Adapts the rate of requests to the host of a given URL to the server response
+        """
+        with self._lock:
+            bucket = self._get_bucket(url)
+            if response.status_code not in PUSHBACK_STATUSES:
+                bucket.pushbacks = 0
+                if bucket.requests_per_second:
+                    bucket.requests_per_second = min(
+                        self._requests_per_second,
+                        bucket.requests_per_second + self._requests_per_second / 10)
+                return
+
+            bucket.pushbacks += 1
+            pause = self._get_retry_after(response)
+            if pause is None:
+                pause = 2 ** (bucket.pushbacks - 1)
+            bucket.next_token_time = max(bucket.next_token_time,
+                                         monotonic() + min(pause, self.max_pause))
+            if bucket.requests_per_second:
+                bucket.requests_per_second = max(self.min_requests_per_second,
+                                                 bucket.requests_per_second / 2)
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response):
+        """
+        Returns seconds a server asks to wait in Retry-After header or None
+        """
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class HTTPClient:
+    """
+    Keeps a pool of keep-alive connections, retries failed requests
+    with exponential backoff, paces requests to each host with a politeness scheduler
+    and measures time of each request.
+    With a response cache, requests for cached pages are conditional
+    and offline client serves pages from the cache only
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5,
+                 timeout: float = 30.0, *, requests_per_second: float = None,
+                 cache: HTTPResponseCache = None, offline: bool = False):
+        # pylint: disable=too-many-arguments
+        if offline and cache is None:
+            raise ValueError('Offline client needs a response cache')
+        self.timeout = timeout
+        self.retries = retries
+        self.scheduler = PolitenessScheduler(requests_per_second)
+        self.cache = cache
+        self.offline = offline
+        self.timings = []
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+        # pushback statuses are retried by get() so that the scheduler paces retries
+        retry = Retry(total=retries, backoff_factor=backoff_factor,
+                      status_forcelist=(500, 502, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, url: str) -> requests.Response:
+        """
+        Requests a page, retrying on 5xx responses, connection errors and timeouts.
+        Requests pushed back with 429 or 503 are retried after the pause
+        the scheduler sets for the host
+        """
+        if self.offline:
+            response = self.cache.build_response(url)
+            if response is None:
+                raise CacheMissError(url)
+            self._count_cache_hit()
+            return response
+
+        headers = self.cache.get_validators(url) if self.cache is not None else {}
+        for _ in range(self.retries + 1):
+            self.scheduler.acquire(url)
+            start = perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            finally:
+                with self._lock:
+                    self.timings.append(perf_counter() - start)
+            self.scheduler.report(url, response)
+            if response.status_code not in PUSHBACK_STATUSES:
+                break
+
+        if self.cache is not None:
+            if response.status_code == 304:
+                cached_response = self.cache.build_response(url)
+                if cached_response is not None:
+                    self._count_cache_hit()
+                    return cached_response
+            elif response.ok:
+                self.cache.store(url, response)
+        return response
+
+    def _count_cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+
+    def get_statistics(self) -> dict:
+        """
+        Returns a number of requests, pages served from the cache,
+        total, mean and longest time of requests and time spent waiting for the scheduler
+        """
+        with self._lock:
+            timings = list(self.timings)
+            cache_hits = self.cache_hits
+        return {
+            'requests': len(timings),
+            'cache_hits': cache_hits,
+            'total_time': sum(timings),
+            'mean_time': sum(timings) / len(timings) if timings else 0.0,
+            'max_time': max(timings, default=0.0),
+            'waiting_time': self.scheduler.waiting_time
+        }
+
+    def close(self):
+        """
+        Closes all pooled connections
+        """
+        self.session.close()
+
+
+DEFAULT_REQUESTS_PER_SECOND = 1.0
+_DEFAULT_CLIENT = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """
+    Returns a client shared by all crawler and parser instances
+    """
+    global _DEFAULT_CLIENT  # pylint: disable=global-statement
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None:
+            _DEFAULT_CLIENT = HTTPClient(requests_per_second=DEFAULT_REQUESTS_PER_SECOND)
+        return _DEFAULT_CLIENT
@@ -0,0 +1,85 @@
+"""
+Manifest of articles processed by the pipeline
+"""
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+from core_utils.article import Article, ArtifactType
+
+# to be increased whenever text cleaning or the format of tagged files changes
+ARTIFACTS_VERSION = 1
+
+
+def get_analyzers_version():
+    """
+    Returns versions of analyzers and dictionaries that produce cached analyses
+    """
+    versions = []
+    for package in ('pymystem3', 'pymorphy2', 'pymorphy2-dicts-ru'):
+        try:
+            versions.append(f'{package}=={metadata.version(package)}')
+        except metadata.PackageNotFoundError:
+            versions.append(f'{package}==unknown')
+    return ';'.join(versions)
+
+
+class PipelineManifest:
+    """
+    Remembers hashes of raw texts whose artifacts are already produced
+    and versions of analyzers and of the artifacts format they were produced with.
+    Artifacts of other versions are out of date
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.version = self.get_version()
+        self._hashes = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as file:
+                manifest = json.load(file)
+            if manifest.get('version') == self.version:
+                self._hashes = manifest['hashes']
+
+    @staticmethod
+    def get_version():
+        """
+        Returns versions of analyzers and of the artifacts format
+        """
+        return f'{get_analyzers_version()};artifacts=={ARTIFACTS_VERSION}'
+
+    @staticmethod
+    def get_text_hash(raw_text: str):
+        """
+        Returns a content hash of a raw text
+        """
+        return hashlib.sha256(raw_text.encode('utf-8')).hexdigest()
+
+    def is_up_to_date(self, article: Article):
+        """
+        Tells whether artifacts of an article were produced from its current raw text
+        """
+        raw_hash = self._hashes.get(str(article.article_id))
+        if raw_hash is None or raw_hash != self.get_text_hash(article.get_raw_text()):
+            return False
+        return all(Path(article.get_file_path(kind)).exists()
+                   for kind in (ArtifactType.cleaned,
+                                ArtifactType.single_tagged,
+                                ArtifactType.multiple_tagged))
+
+    def update(self, article_id: int, raw_hash: str):
+        """
+        Records a hash of a processed raw text
+        """
+        self._hashes[str(article_id)] = raw_hash
+
+    def save(self):
+        """
+        Writes the manifest to disk
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix('.tmp')
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': self.version, 'hashes': self._hashes}, file, indent=4)
+        temporary_path.replace(self.path)
@@ -2,37 +2,81 @@
 Visualizer module for visualizing PosFrequencyPipeline results
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+COLORS = ('b', 'g', 'r', 'c')
+
+
+class ChartRenderer:
+    """
+    Draws frequency charts on a single figure of the non-interactive Agg backend,
+    the figure and its ticks are reused, only bars are replaced for every chart
+    """
+
+    def __init__(self):
+        self.figure = Figure()
+        FigureCanvasAgg(self.figure)
+        self.axis = self.figure.add_subplot(1, 1, 1)
+
+    def render(self, statistics: dict, path_to_save: Path):
+        """
+        Saves a bar chart of frequencies sorted in descending order
+        """
+        sorted_tags = sorted(statistics, key=statistics.get, reverse=True)
+        sorted_frequencies = [statistics[tag] for tag in sorted_tags]
+        pos_tags = np.arange(len(sorted_tags))
+
+        for bars in list(self.axis.containers):
+            bars.remove()
+        self.axis.bar(pos_tags, sorted_frequencies, align='center', width=0.5,
+                      color=[COLORS[i % len(COLORS)] for i in pos_tags])
+        self.axis.relim()
+        self.axis.autoscale_view()
+        self.axis.set_xticks(pos_tags)
+        self.axis.set_xticklabels(sorted_tags, rotation=20)
+        self.axis.set_ylim(0, max(sorted_frequencies, default=0) + 1)
+        self.figure.savefig(path_to_save)
+
+
+_RENDERER = None
 
 
 def visualize(statistics: dict, path_to_save: Path):
     """
     param: statistics is a dictionary with keys:POS tags, values:frequencies
     """
-    number_of_tags = len(statistics)
-    sorted_frequencies = sorted(statistics.values(), reverse=True)
-    sorted_tags = sorted(statistics, key=statistics.get, reverse=True)
+    global _RENDERER  # pylint: disable=global-statement
+    if _RENDERER is None:
+        _RENDERER = ChartRenderer()
+    _RENDERER.render(statistics, path_to_save)
 
-    pos_tags = np.arange(number_of_tags)
-    colors = ('b', 'g', 'r', 'c')
 
-    figure = plt.figure()
-    axis = figure.add_subplot(1, 1, 1)
-    for i in range(0, number_of_tags):
-        axis.bar(pos_tags[i], sorted_frequencies[i],
-                 align='center', width=0.5,
-                 color=colors[i % len(colors)])
+def _render_charts(charts: list):
+    """
+    Renders a share of charts in a worker process
+    """
+    renderer = ChartRenderer()
+    for statistics, path_to_save in charts:
+        renderer.render(statistics, path_to_save)
 
-    axis.set_xticks(pos_tags)
-    axis.set_xticklabels(sorted_tags)
-    plt.setp(sorted_tags)
-    plt.xticks(rotation=20)
-    y_max = max(sorted_frequencies) + 1
-    plt.ylim(0, y_max)
 
-    plt.savefig(path_to_save)
+def visualize_batch(charts, workers: int = 1):
+    """
+    Renders many charts given as (statistics, path_to_save) pairs,
+    sharing them between worker processes if several workers are requested
+    """
+    charts = list(charts)
+    if workers <= 1:
+        _render_charts(charts)
+        return
+    number_of_shares = min(len(charts), 4 * workers)
+    shares = [charts[start::number_of_shares] for start in range(number_of_shares)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_render_charts, shares))
 
 
 if __name__ == "__main__":
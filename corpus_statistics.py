@@ -0,0 +1,215 @@
+"""
+Corpus-wide statistics of processed articles
+"""
+import re
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from constants import ASSETS_PATH
+from core_utils.article import Article, ArtifactType
+from pipeline import CorpusManager
+
+# lemma and part of speech of a lemma<tags> token
+TAGGED_TOKEN_PATTERN = re.compile(r'([^\s<]+)<([A-Z]*)')
+
+
+def count_tagged_tokens(single_tagged_path) -> tuple:
+    """
+    Counts lemmas and Mystem parts of speech in a single-tagged file
+    """
+    lemma_frequencies = Counter()
+    pos_frequencies = Counter()
+    with open(single_tagged_path, encoding='utf-8') as file:
+        for lemma, pos in TAGGED_TOKEN_PATTERN.findall(file.read()):
+            lemma_frequencies[lemma] += 1
+            if pos:
+                pos_frequencies[pos] += 1
+    return lemma_frequencies, pos_frequencies
+
+
+class FrequencyMatrix:
+    """
+    Sparse matrix of counts with a row per article and a column per term,
+    growing as articles and terms are added
+    """
+
+    def __init__(self):
+        self.term_ids = {}
+        self.terms = []
+        self.counts = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self.totals = np.zeros(0, dtype=np.int64)
+        self.document_frequencies = np.zeros(0, dtype=np.int64)
+
+    def add_rows(self, rows_frequencies: list):
+        """
+        Appends rows built from dictionaries of term frequencies
+        """
+        indptr = [0]
+        indices = []
+        data = []
+        for frequencies in rows_frequencies:
+            for term, count in frequencies.items():
+                term_id = self.term_ids.get(term)
+                if term_id is None:
+                    term_id = self.term_ids[term] = len(self.terms)
+                    self.terms.append(term)
+                indices.append(term_id)
+                data.append(count)
+            indptr.append(len(indices))
+
+        number_of_terms = len(self.terms)
+        new_counts = sparse.csr_matrix((np.array(data, dtype=np.int64),
+                                        np.array(indices, dtype=np.int32),
+                                        np.array(indptr, dtype=np.int32)),
+                                       shape=(len(rows_frequencies), number_of_terms))
+        old_counts = sparse.csr_matrix((self.counts.data, self.counts.indices, self.counts.indptr),
+                                       shape=(self.counts.shape[0], number_of_terms))
+        self.counts = sparse.vstack([old_counts, new_counts], format='csr')
+
+        self.totals = np.pad(self.totals, (0, number_of_terms - len(self.totals)))
+        self.totals += np.bincount(new_counts.indices, weights=new_counts.data,
+                                   minlength=number_of_terms).astype(np.int64)
+        self.document_frequencies = np.pad(self.document_frequencies,
+                                           (0, number_of_terms - len(self.document_frequencies)))
+        self.document_frequencies += np.bincount(new_counts.indices, minlength=number_of_terms)
+
+    def get_totals(self, rows=None):
+        """
+        Returns counts of terms summed over given rows or over all of them
+        """
+        if rows is None:
+            return self.totals
+        return np.asarray(self.counts[rows].sum(axis=0)).ravel()
+
+    def get_top(self, totals, top: int) -> dict:
+        """
+        Returns the most frequent terms with their counts in descending order
+        """
+        top = min(top, np.count_nonzero(totals))
+        if top <= 0:
+            return {}
+        candidates = np.argpartition(-totals, top - 1)[:top]
+        candidates = candidates[np.lexsort((candidates, -totals[candidates]))]
+        return {self.terms[term_id]: int(totals[term_id]) for term_id in candidates}
+
+
+class CorpusStatistics:
+    """
+    Lemma and POS frequencies of the whole corpus kept in document x lemma
+    and document x POS matrices, so that queries over any subset of articles
+    do not read the dataset again. Counts of an article are taken from its meta file
+    where the pipeline saved them and from its single-tagged file otherwise
+    """
+
+    def __init__(self, corpus_manager: CorpusManager):
+        self.corpus_manager = corpus_manager
+        self.article_ids = []
+        self.rows = {}
+        self.lemmas = FrequencyMatrix()
+        self.pos = FrequencyMatrix()
+        self._dates = np.array([], dtype='datetime64[s]')
+        self._topic_rows = {}
+
+    def update(self, corpus_manager: CorpusManager = None) -> int:
+        """
+        Adds processed articles that are not counted yet,
+        returns a number of added articles
+        """
+        if corpus_manager is not None:
+            self.corpus_manager = corpus_manager
+        self.corpus_manager.load_meta()
+        articles = self.corpus_manager.get_articles()
+        new_articles = [articles[article_id] for article_id in sorted(articles)
+                        if article_id not in self.rows]
+        return self.add_articles(new_articles)
+
+    def add_articles(self, articles: list) -> int:
+        """
+        Adds rows of given articles, articles without tagged files are skipped
+        """
+        lemma_rows = []
+        pos_rows = []
+        dates = []
+        for article in articles:
+            counts = self._get_counts(article)
+            if counts is None:
+                continue
+            row = len(self.article_ids)
+            self.article_ids.append(article.article_id)
+            self.rows[article.article_id] = row
+            lemma_rows.append(counts[0])
+            pos_rows.append(counts[1])
+            dates.append(np.datetime64(article.date, 's') if article.date else np.datetime64('NaT'))
+            for topic in article.topics or []:
+                self._topic_rows.setdefault(topic, []).append(row)
+
+        if lemma_rows:
+            self.lemmas.add_rows(lemma_rows)
+            self.pos.add_rows(pos_rows)
+            self._dates = np.concatenate([self._dates, np.array(dates, dtype='datetime64[s]')])
+        return len(lemma_rows)
+
+    def get_top_lemmas(self, top: int = 50, *, topic: str = None, start=None, end=None) -> dict:
+        """
+        Returns the most frequent lemmas of articles of a topic and a date range,
+        the range includes its start and excludes its end
+        """
+        return self.lemmas.get_top(self.lemmas.get_totals(self._select_rows(topic, start, end)),
+                                   top)
+
+    def get_pos_frequencies(self, *, topic: str = None, start=None, end=None) -> dict:
+        """
+        Returns frequencies of parts of speech of articles of a topic and a date range
+        """
+        totals = self.pos.get_totals(self._select_rows(topic, start, end))
+        return self.pos.get_top(totals, len(self.pos.terms))
+
+    def get_document_frequencies(self) -> dict:
+        """
+        Returns numbers of articles each lemma occurs in
+        """
+        return dict(zip(self.lemmas.terms, self.lemmas.document_frequencies.tolist()))
+
+    def _select_rows(self, topic: str, start, end):
+        """
+        Returns rows of articles matching a topic and a date range or None for all rows
+        """
+        if topic is None and start is None and end is None:
+            return None
+        mask = np.ones(len(self.article_ids), dtype=bool)
+        if topic is not None:
+            topic_mask = np.zeros_like(mask)
+            topic_mask[self._topic_rows.get(topic, [])] = True
+            mask &= topic_mask
+        if start is not None:
+            mask &= self._dates >= np.datetime64(start, 's')
+        if end is not None:
+            mask &= self._dates < np.datetime64(end, 's')
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _get_counts(article: Article):
+        """
+        Returns lemma and POS frequencies of an article or None if it is not processed yet
+        """
+        if article.lemma_frequencies is not None and article.pos_frequencies is not None:
+            return article.lemma_frequencies, article.pos_frequencies
+        single_tagged_path = article.get_file_path(ArtifactType.single_tagged)
+        if not single_tagged_path.exists():
+            return None
+        return count_tagged_tokens(single_tagged_path)
+
+
+def main():
+    corpus_statistics = CorpusStatistics(CorpusManager(path_to_raw_txt_data=ASSETS_PATH))
+    corpus_statistics.update()
+    print(f'Articles: {len(corpus_statistics.article_ids)}, '
+          f'lemmas: {len(corpus_statistics.lemmas.terms)}')
+    print(f'Parts of speech: {corpus_statistics.get_pos_frequencies()}')
+    print(f'Top lemmas: {corpus_statistics.get_top_lemmas(20)}')
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,32 @@
 Pipeline for text processing implementationnn
 """
 
+from abc import ABC, abstractmethod
+import argparse
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
 from pathlib import Path
 import re
+import sqlite3
+import time
 
 import pymorphy2
 from pymystem3 import Mystem
 
-from constants import ASSETS_PATH
-from core_utils.article import Article, ArtifactType
+from constants import ASSETS_PATH, MORPHOLOGY_CACHE_PATH, PIPELINE_MANIFEST_PATH
+from core_utils.article import Article, iter_dataset_files
+from core_utils.dataset_index import DatasetIndex
+from core_utils.pipeline_manifest import PipelineManifest, get_analyzers_version
+
+NON_LETTERS_PATTERN = re.compile(r'[^а-яА-ЯёЁa-zA-Z]+')
+# part of speech opens Mystem tags
+MYSTEM_POS_PATTERN = re.compile(r'[A-Z]+')
+
+# joins several articles for one Mystem call; cleaned texts never contain '|'
+BATCH_SEPARATOR_MARK = '|'
+BATCH_SEPARATOR = f' . {BATCH_SEPARATOR_MARK} . '
 
 
 class EmptyDirectoryError(Exception):
@@ -27,17 +45,25 @@ class InconsistentDatasetError(Exception):
     """
 
 
+def clean_text(raw_text: str) -> str:
+    """
+    Replaces each run of characters other than Russian and Latin letters
+    with a single space, so the result is one line of words
+    """
+    return NON_LETTERS_PATTERN.sub(' ', raw_text)
+
+
 class MorphologicalToken:
     """
     Stores language params for each processed token
     """
+    __slots__ = ('original_word', 'normalized_form', 'tags_mystem', 'tags_pymorphy')
 
     def __init__(self, original_word):
         self.original_word = original_word
         self.normalized_form = ''
         self.tags_mystem = ''
         self.tags_pymorphy = ''
-        pass
 
     def get_cleaned(self):
         """
@@ -58,6 +84,209 @@ class MorphologicalToken:
         return f'{self.normalized_form}<{self.tags_mystem}>({self.tags_pymorphy})'
 
 
+class TokenVocabulary:
+    """
+    Interns lemmas and tags, giving each distinct string an integer id
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._values = []
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, value_id: int):
+        return self._values[value_id]
+
+    def get_id(self, value: str):
+        """
+        Returns an id of a string, registering it if met for the first time
+        """
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+
+class MorphologicalTokens:
+    """
+    Stores tokens of a text column by column: surface forms in one buffer,
+    lemmas and tags as ids of a vocabulary shared by all texts
+    """
+
+    def __init__(self, vocabulary: TokenVocabulary):
+        self.vocabulary = vocabulary
+        self._surface = ''
+        self._pending_words = []
+        self._ends = array('I')
+        self._lemmas = array('I')
+        self._tags_mystem = array('I')
+        self._tags_pymorphy = array('I')
+
+    def __len__(self):
+        return len(self._ends)
+
+    def __getitem__(self, index: int):
+        token = MorphologicalToken(self._get_word(index))
+        token.normalized_form = self.vocabulary[self._lemmas[index]]
+        token.tags_mystem = self.vocabulary[self._tags_mystem[index]]
+        token.tags_pymorphy = self.vocabulary[self._tags_pymorphy[index]]
+        return token
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, original_word: str, normalized_form: str, tags_mystem: str, tags_pymorphy: str):
+        """
+        Adds a token to the end of a text
+        """
+        previous_end = self._ends[-1] if self._ends else 0
+        self._pending_words.append(original_word)
+        self._ends.append(previous_end + len(original_word))
+        self._lemmas.append(self.vocabulary.get_id(normalized_form))
+        self._tags_mystem.append(self.vocabulary.get_id(tags_mystem))
+        self._tags_pymorphy.append(self.vocabulary.get_id(str(tags_pymorphy)))
+
+    def get_cleaned(self):
+        """
+        Returns lowercased original forms of tokens
+        """
+        return (self._get_word(index).lower() for index in range(len(self)))
+
+    def get_single_tagged(self):
+        """
+        Returns normalized lemmas with MyStem tags
+        """
+        vocabulary = self.vocabulary
+        return (f'{vocabulary[lemma]}<{vocabulary[tags_mystem]}>'
+                for lemma, tags_mystem in zip(self._lemmas, self._tags_mystem))
+
+    def get_multiple_tagged(self):
+        """
+        Returns normalized lemmas with MyStem and PyMorphy tags
+        """
+        vocabulary = self.vocabulary
+        return (f'{vocabulary[lemma]}<{vocabulary[tags_mystem]}>({vocabulary[tags_pymorphy]})'
+                for lemma, tags_mystem, tags_pymorphy
+                in zip(self._lemmas, self._tags_mystem, self._tags_pymorphy))
+
+    def _get_word(self, index: int):
+        """
+        Cuts a surface form of a token out of the buffer
+        """
+        if self._pending_words:
+            self._surface += ''.join(self._pending_words)
+            self._pending_words = []
+        start = self._ends[index - 1] if index else 0
+        return self._surface[start:self._ends[index]]
+
+
+class TokenObserver(ABC):
+    """
+    Collects statistics from tokens of each article while they are saved.
+    Statistics of a single article may be stored in its meta file,
+    statistics of the whole corpus are merged from worker processes
+    """
+    updates_meta = False
+
+    @abstractmethod
+    def observe(self, token: MorphologicalToken):
+        """
+        Takes the next token of the current article
+        """
+
+    @abstractmethod
+    def finish_article(self, article: Article):
+        """
+        Adds statistics of the current article to the corpus ones,
+        sets them on the article if the observer updates meta files
+        """
+
+    @abstractmethod
+    def merge(self, other: 'TokenObserver'):
+        """
+        Adds corpus statistics collected by another observer of the same kind
+        """
+
+    def empty(self) -> 'TokenObserver':
+        """
+        Returns an observer of the same kind with nothing collected
+        """
+        return type(self)()
+
+
+class POSCounter(TokenObserver):
+    """
+    Counts Mystem parts of speech, saving them as pos_frequencies of each article
+    """
+    updates_meta = True
+
+    def __init__(self):
+        self.frequencies = Counter()
+        self._tags = Counter()
+
+    def observe(self, token: MorphologicalToken):
+        self._tags[token.tags_mystem] += 1
+
+    def finish_article(self, article: Article):
+        frequencies = Counter()
+        for tags, count in self._tags.items():
+            match = MYSTEM_POS_PATTERN.match(tags)
+            if match:
+                frequencies[match.group()] += count
+        self._tags = Counter()
+        article.pos_frequencies = dict(frequencies.most_common())
+        self.frequencies.update(frequencies)
+
+    def merge(self, other: 'POSCounter'):
+        self.frequencies.update(other.frequencies)
+
+
+class LemmaCounter(TokenObserver):
+    """
+    Counts lemmas, saving them as lemma_frequencies of each article
+    """
+    updates_meta = True
+
+    def __init__(self):
+        self.frequencies = Counter()
+        self._lemmas = Counter()
+
+    def observe(self, token: MorphologicalToken):
+        self._lemmas[token.normalized_form] += 1
+
+    def finish_article(self, article: Article):
+        article.lemma_frequencies = dict(self._lemmas.most_common())
+        self.frequencies.update(self._lemmas)
+        self._lemmas = Counter()
+
+    def merge(self, other: 'LemmaCounter'):
+        self.frequencies.update(other.frequencies)
+
+
+class VocabularyBuilder(TokenObserver):
+    """
+    Collects lemmas of the corpus with numbers of articles they occur in
+    """
+
+    def __init__(self):
+        self.document_frequencies = Counter()
+        self._lemmas = set()
+
+    def observe(self, token: MorphologicalToken):
+        self._lemmas.add(token.normalized_form)
+
+    def finish_article(self, article: Article):
+        self.document_frequencies.update(self._lemmas)
+        self._lemmas = set()
+
+    def merge(self, other: 'VocabularyBuilder'):
+        self.document_frequencies.update(other.document_frequencies)
+
+
 class CorpusManager:
     """
     Works with articles and stores them
@@ -66,18 +295,36 @@ class CorpusManager:
     def __init__(self, path_to_raw_txt_data: str):
         self.path_to_raw_txt_data = Path(path_to_raw_txt_data)
         self._storage = {}
+        self._metas = {}
+        self._index = DatasetIndex(self.path_to_raw_txt_data)
         self._scan_dataset()
         pass
 
     def _scan_dataset(self):
         """
-        Register each dataset entry
+        Register each dataset entry,
+        files are taken from the dataset index if it is up to date
         """
-        path_to_raw = Path(self.path_to_raw_txt_data)
-
-        for file in path_to_raw.glob('*_raw.txt'):
-            article_id = int(file.stem.split('_')[0])
-            self._storage[article_id] = Article(url=None, article_id=article_id)
+        entries = self._index.get_entries()
+        for relative_path, entry in entries.items():
+            file_name = relative_path.rsplit('/', 1)[-1]
+            if file_name.endswith('_raw.txt'):
+                article_id = int(file_name.split('_')[0])
+                self._storage[article_id] = Article(url=None, article_id=article_id)
+            elif file_name.endswith('_meta.json') and 'meta' in entry:
+                self._metas[int(file_name.split('_')[0])] = entry
+
+    def load_meta(self):
+        """
+        Loads metadata of all articles at once, from the dataset index
+        where meta files are unchanged since they were recorded and from meta files otherwise
+        """
+        for article_id, article in self._storage.items():
+            entry = self._metas.get(article_id)
+            if entry is not None and self._index.is_current(entry):
+                article.set_meta(entry['meta'])
+            else:
+                article.load_meta()
 
     pass
 
@@ -88,71 +335,562 @@ class CorpusManager:
         return self._storage
 
 
+class ParseCache:
+    """
+    Bounded cache of pymorphy2 tags keyed by word form,
+    evicts least recently used words first
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._tags = OrderedDict()
+
+    def __len__(self):
+        return len(self._tags)
+
+    def get(self, word: str):
+        """
+        Returns a cached tag of a word or None
+        """
+        tag = self._tags.get(word)
+        if tag is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tags.move_to_end(word)
+        return tag
+
+    def put(self, word: str, tag: str):
+        """
+        Caches a tag of a word, evicting the least recently used one if full
+        """
+        if self.max_size <= 0:
+            return
+        self._tags[word] = tag
+        self._tags.move_to_end(word)
+        if len(self._tags) > self.max_size:
+            self._tags.popitem(last=False)
+
+    def items(self):
+        """
+        Returns cached (word, tag) pairs from the least to the most recently used
+        """
+        return self._tags.items()
+
+
+class MorphologyCache:
+    """
+    Persistent storage of word form analyses shared across pipeline runs.
+    Mystem disambiguates words by context, so a form is trusted only
+    while all its occurrences were analyzed the same way. Still, this is an
+    approximation: a form seen in one context only may be analyzed
+    differently in a new one, so the storage is not used by default
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.size_on_open = 0
+        self.cached_articles = 0
+        self._connection = None
+
+    @property
+    def is_open(self):
+        """
+        Tells whether the storage is opened
+        """
+        return self._connection is not None
+
+    def open(self):
+        """
+        Opens the storage, dropping analyses made by other analyzers versions
+        """
+        if self.is_open:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=60)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS words (word TEXT PRIMARY KEY, lemma TEXT, '
+                                 'tags_mystem TEXT, tags_pymorphy TEXT, ambiguous INTEGER)')
+        version = get_analyzers_version()
+        stored_version = self._connection.execute("SELECT value FROM info WHERE key = 'version'").fetchone()
+        if stored_version is None or stored_version[0] != version:
+            self._connection.execute('DELETE FROM words')
+            self._connection.execute("INSERT OR REPLACE INTO info VALUES ('version', ?)", (version,))
+        self._connection.commit()
+        self.size_on_open = self._connection.execute('SELECT COUNT(*) FROM words').fetchone()[0]
+
+    def close(self):
+        """
+        Saves pending changes and closes the storage
+        """
+        if self.is_open:
+            self._connection.commit()
+            self._connection.close()
+        self._connection = None
+
+    def get_tokens(self, words: list, vocabulary: TokenVocabulary):
+        """
+        Returns tokens for given words if all of them are stored and unambiguous,
+        otherwise returns None and the text must be analyzed
+        """
+        unique_words = list(set(words))
+        known = {}
+        for start in range(0, len(unique_words), 500):
+            chunk = unique_words[start:start + 500]
+            rows = self._connection.execute(
+                f'SELECT word, lemma, tags_mystem, tags_pymorphy FROM words '
+                f'WHERE ambiguous = 0 AND word IN ({", ".join("?" * len(chunk))})', chunk)
+            known.update((row[0], row[1:]) for row in rows)
+        if len(known) != len(unique_words):
+            return None
+
+        tokens = MorphologicalTokens(vocabulary)
+        for word in words:
+            lemma, tags_mystem, tags_pymorphy = known[word]
+            if lemma is not None:
+                tokens.append(word, lemma, tags_mystem, tags_pymorphy)
+        self.cached_articles += 1
+        return tokens
+
+    def store(self, tokens: MorphologicalTokens, unknown_words: list):
+        """
+        Stores analyses of a text: its tokens and words Mystem could not analyze.
+        A word analyzed in different ways within the text is stored as ambiguous
+        """
+        rows = {}
+        ambiguous_words = set()
+        analyses = [(token.original_word, (token.normalized_form, token.tags_mystem,
+                                           str(token.tags_pymorphy))) for token in tokens]
+        analyses.extend((word, (None, None, None)) for word in unknown_words)
+        for word, analysis in analyses:
+            if rows.setdefault(word, analysis)[:2] != analysis[:2]:
+                ambiguous_words.add(word)
+        self._connection.executemany(
+            'INSERT INTO words VALUES (?, ?, ?, ?, ?) ON CONFLICT(word) DO UPDATE SET '
+            'ambiguous = ambiguous OR excluded.ambiguous OR lemma IS NOT excluded.lemma '
+            'OR tags_mystem IS NOT excluded.tags_mystem',
+            ((word, *analysis, int(word in ambiguous_words)) for word, analysis in rows.items()))
+        self._connection.commit()
+
+
+class MorphologicalAnalyzers:
+    """
+    Owns Mystem and pymorphy2 instances shared by all processed articles
+    """
+
+    def __init__(self, cache_size: int = 100000, morphology_cache_path: Path = None):
+        self.mystem = None
+        self.morph_analyzer = None
+        self.parse_cache = ParseCache(cache_size)
+        self.morphology_cache = None
+        if morphology_cache_path is not None:
+            self.morphology_cache = MorphologyCache(morphology_cache_path)
+        self.startup_time = 0.0
+        self.analysis_time = 0.0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def is_open(self):
+        """
+        Tells whether analyzers are started
+        """
+        return self.mystem is not None
+
+    def open(self):
+        """
+        Loads dictionaries and starts Mystem process unless already done
+        """
+        if self.is_open:
+            return
+        start = time.perf_counter()
+        self.morph_analyzer = pymorphy2.MorphAnalyzer()
+        self.mystem = Mystem()
+        self.mystem.start()
+        if self.morphology_cache is not None:
+            self.morphology_cache.open()
+        self.startup_time += time.perf_counter() - start
+
+    def close(self):
+        """
+        Terminates Mystem process and releases dictionaries
+        """
+        if self.mystem is not None:
+            self.mystem.close()
+        if self.morphology_cache is not None:
+            self.morphology_cache.close()
+        self.mystem = None
+        self.morph_analyzer = None
+
+    def analyze(self, text: str):
+        """
+        Returns Mystem analysis of a given text
+        """
+        start = time.perf_counter()
+        analyzed_text = self.mystem.analyze(text)
+        self.analysis_time += time.perf_counter() - start
+        return analyzed_text
+
+    def get_pymorphy_tag(self, word: str):
+        """
+        Returns the most probable pymorphy2 tag of a given word
+        """
+        tag = self.parse_cache.get(word)
+        if tag is None:
+            start = time.perf_counter()
+            tag = str(self.morph_analyzer.parse(word)[0].tag)
+            self.analysis_time += time.perf_counter() - start
+            self.parse_cache.put(word, tag)
+        return tag
+
+    def get_statistics(self):
+        """
+        Returns time spent on startup and analysis and parse cache counters
+        """
+        statistics = {
+            'startup_time': self.startup_time,
+            'analysis_time': self.analysis_time,
+            'cache_hits': self.parse_cache.hits,
+            'cache_misses': self.parse_cache.misses,
+            'persistent_cache_size': 0,
+            'persistent_cache_articles': 0
+        }
+        if self.morphology_cache is not None:
+            statistics['persistent_cache_size'] = self.morphology_cache.size_on_open
+            statistics['persistent_cache_articles'] = self.morphology_cache.cached_articles
+        return statistics
+
+    def pop_statistics(self):
+        """
+        Returns statistics collected so far and resets them
+        """
+        statistics = self.get_statistics()
+        self.startup_time = self.analysis_time = 0.0
+        self.parse_cache.hits = self.parse_cache.misses = 0
+        if self.morphology_cache is not None:
+            self.morphology_cache.cached_articles = 0
+        return statistics
+
+    def add_statistics(self, statistics: dict):
+        """
+        Adds statistics collected by analyzers of another process
+        """
+        self.startup_time += statistics['startup_time']
+        self.analysis_time += statistics['analysis_time']
+        self.parse_cache.hits += statistics['cache_hits']
+        self.parse_cache.misses += statistics['cache_misses']
+        if self.morphology_cache is not None:
+            self.morphology_cache.size_on_open = max(self.morphology_cache.size_on_open,
+                                                     statistics['persistent_cache_size'])
+            self.morphology_cache.cached_articles += statistics['persistent_cache_articles']
+
+
 class TextProcessingPipeline:
     """
     Process articles from corpus manager
     """
+    # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, corpus_manager: CorpusManager):
+    def __init__(self, corpus_manager: CorpusManager, *, batch_size: int = 1, workers: int = 1,
+                 cache_size: int = 100000, morphology_cache_path: Path = None,
+                 manifest_path: Path = None, observers: list = None):
+        # pylint: disable=too-many-arguments
         self.corpus_manager = corpus_manager
-        pass
+        self.observers = observers or []
+        self.batch_size = batch_size
+        self.workers = workers
+        self.cache_size = cache_size
+        self.morphology_cache_path = morphology_cache_path
+        self.analyzers = MorphologicalAnalyzers(cache_size, morphology_cache_path)
+        self.vocabulary = TokenVocabulary()
+        self.manifest = None
+        if manifest_path is not None:
+            self.manifest = PipelineManifest(manifest_path)
+        self.skipped_articles = 0
+        self.errors = {}
+
+    def __enter__(self):
+        if self.workers <= 1:
+            self.analyzers.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.analyzers.close()
 
     def run(self):
         """
         Runs pipeline process scenario
         """
-        articles = self.corpus_manager.get_articles().values()
-
-        for article in articles:
-            raw_text = article.get_raw_text()
-            tokens = self._process(raw_text)
-
-            clean = []
-            single_tagged = []
-            multiple_tagged = []
-
-            for token in tokens:
-                clean.append(token.get_cleaned())
-                single_tagged.append(token.get_single_tagged())
-                multiple_tagged.append(token.get_multiple_tagged())
+        articles = [self.corpus_manager.get_articles()[article_id]
+                    for article_id in sorted(self.corpus_manager.get_articles())]
+
+        # observers collect statistics of the whole corpus, so nothing is skipped for them
+        if self.manifest is not None and not self.observers:
+            articles = [article for article in articles if not self.manifest.is_up_to_date(article)]
+            self.skipped_articles = len(self.corpus_manager.get_articles()) - len(articles)
+
+        batches = [articles[start:start + self.batch_size]
+                   for start in range(0, len(articles), self.batch_size)]
+
+        try:
+            if self.workers > 1:
+                self._run_in_parallel(batches)
+            else:
+                self._run_serially(batches)
+        finally:
+            if self.manifest is not None:
+                self.manifest.save()
+
+    def get_summary(self):
+        """
+        Returns time spent on starting analyzers and on analysis itself
+        and cache counters, summed over all worker processes,
+        and numbers of up-to-date and failed articles
+        """
+        summary = self.analyzers.get_statistics()
+        summary['skipped_articles'] = self.skipped_articles
+        summary['errors'] = len(self.errors)
+        return summary
 
-            article.save_as(' '.join(clean), ArtifactType.cleaned)
-            article.save_as(' '.join(single_tagged), ArtifactType.single_tagged)
-            article.save_as(' '.join(multiple_tagged), ArtifactType.multiple_tagged)
-        pass
+    def _run_serially(self, batches: list):
+        """
+        Processes batches of articles in the current process
+        """
+        started_here = not self.analyzers.is_open
+        self.analyzers.open()
+        try:
+            for batch in batches:
+                self._process_articles(batch)
+        finally:
+            if started_here:
+                self.analyzers.close()
+
+    def _run_in_parallel(self, batches: list):
+        """
+        Shards batches of articles across worker processes,
+        each of them keeping its own analyzers for the whole run
+        """
+        settings = {
+            'batch_size': self.batch_size,
+            'cache_size': self.cache_size,
+            'morphology_cache_path': self.morphology_cache_path,
+            'observers': [observer.empty() for observer in self.observers]
+        }
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(settings,)) as executor:
+            for errors, statistics, raw_hashes, observers in executor.map(_process_in_worker,
+                                                                          batches):
+                self.errors.update(errors)
+                self.analyzers.add_statistics(statistics)
+                for observer, worker_observer in zip(self.observers, observers):
+                    observer.merge(worker_observer)
+                if self.manifest is not None:
+                    for article_id, raw_hash in raw_hashes.items():
+                        self.manifest.update(article_id, raw_hash)
+        self.errors = dict(sorted(self.errors.items()))
+
+    def _process_articles(self, articles: list):
+        """
+        Processes and saves a batch of articles,
+        returns hashes of their raw texts
+        """
+        raw_texts = [article.get_raw_text() for article in articles]
+        tokens_batch = self._process_batch(raw_texts)
+        raw_hashes = {}
+        for article, raw_text, tokens in zip(articles, raw_texts, tokens_batch):
+            self._save_tokens(article, tokens)
+            raw_hashes[article.article_id] = PipelineManifest.get_text_hash(raw_text)
+            if self.manifest is not None:
+                self.manifest.update(article.article_id, raw_hashes[article.article_id])
+        return raw_hashes
+
+    def _save_tokens(self, article: Article, tokens: MorphologicalTokens):
+        """
+        Saves all artifacts of a processed article, feeding its tokens to observers
+        on the way and saving their statistics of the article to its meta file
+        """
+        if not self.observers:
+            article.save_tokens(tokens)
+            return
+        article.save_tokens(self._observe(tokens))
+        for observer in self.observers:
+            observer.finish_article(article)
+        if (any(observer.updates_meta for observer in self.observers)
+                and article.get_meta_file_path().exists()):
+            article.save_meta()
+
+    def _observe(self, tokens: MorphologicalTokens):
+        """
+        Passes tokens through, showing each of them to every observer
+        """
+        observers = [observer.observe for observer in self.observers]
+        for token in tokens:
+            for observe in observers:
+                observe(token)
+            yield token
 
     def _process(self, raw_text: str):
         """
         Processes each token and creates MorphToken class instance
         """
-        pattern = re.compile(r'[а-яА-Яa-zA-z ёЁ]')
-        cleaned_text = raw_text
-        for letter in raw_text:
-            if not pattern.match(letter):
-                cleaned_text = raw_text.replace(letter, ' ')
+        return self._process_batch([raw_text])[0]
 
-        morph_analyzer = pymorphy2.MorphAnalyzer()
-        analyzed_text = Mystem().analyze(cleaned_text)
-        tokens = []
+    def _process_batch(self, raw_texts: list):
+        """
+        Processes several texts, taking analyses of known texts from the
+        persistent cache and analyzing the rest with a single Mystem call
+        """
+        cleaned_texts = [clean_text(raw_text) for raw_text in raw_texts]
+        tokens_batch = [None] * len(cleaned_texts)
+
+        morphology_cache = self.analyzers.morphology_cache
+        if morphology_cache is not None:
+            tokens_batch = [morphology_cache.get_tokens(cleaned_text.split(), self.vocabulary)
+                            for cleaned_text in cleaned_texts]
+
+        to_analyze = [index for index, tokens in enumerate(tokens_batch) if tokens is None]
+        if to_analyze:
+            analyzed_batch = self._analyze_batch([cleaned_texts[index] for index in to_analyze])
+            for index, tokens in zip(to_analyze, analyzed_batch):
+                tokens_batch[index] = tokens
+        return tokens_batch
+
+    def _analyze_batch(self, cleaned_texts: list):
+        """
+        Analyzes several texts with a single Mystem call
+        and splits the tokens back into one list per text
+        """
+        analyzed_text = self.analyzers.analyze(BATCH_SEPARATOR.join(cleaned_texts))
+        tokens_batch = [MorphologicalTokens(self.vocabulary)]
+        unknown_words = [[]]
 
         for single_word_analysis in analyzed_text:
             if 'analysis' not in single_word_analysis:
+                # Mystem may merge separators around a text without words into one item
+                for _ in range(single_word_analysis['text'].count(BATCH_SEPARATOR_MARK)):
+                    tokens_batch.append(MorphologicalTokens(self.vocabulary))
+                    unknown_words.append([])
                 continue
             if not single_word_analysis['analysis']:
+                unknown_words[-1].append(single_word_analysis['text'])
                 continue
 
-            token = MorphologicalToken(single_word_analysis['text'])
-            tokens.append(token)
-            token.normalized_form = single_word_analysis['analysis'][0]['lex']
-            token.tags_mystem = single_word_analysis['analysis'][0]['gr']
-            token.tags_pymorphy = morph_analyzer.parse(single_word_analysis['text'])[0].tag
+            tokens_batch[-1].append(single_word_analysis['text'],
+                                    single_word_analysis['analysis'][0]['lex'],
+                                    single_word_analysis['analysis'][0]['gr'],
+                                    self.analyzers.get_pymorphy_tag(single_word_analysis['text']))
 
-        return tokens
+        if len(tokens_batch) != len(cleaned_texts):
+            raise RuntimeError('Mystem output does not preserve boundaries of batched texts')
 
+        if self.analyzers.morphology_cache is not None:
+            for tokens, words in zip(tokens_batch, unknown_words):
+                self.analyzers.morphology_cache.store(tokens, words)
+        return tokens_batch
 
-def validate_dataset(path_to_validate):
+
+_WORKER_PIPELINE = None
+
+
+def _init_worker(settings: dict):
     """
-    Validates folder with assets
+    Starts analyzers of a worker process once for all its tasks
+    """
+    global _WORKER_PIPELINE  # pylint: disable=global-statement
+    _WORKER_PIPELINE = TextProcessingPipeline(corpus_manager=None, **settings)
+    _WORKER_PIPELINE.analyzers.open()
+
+
+def _process_in_worker(articles: list):
+    """
+    Processes a batch of articles in a worker process.
+    If the batch fails, its articles are retried one by one
+    so that errors are reported with ids of the failed articles
+    """
+    errors = {}
+    raw_hashes = {}
+    try:
+        raw_hashes = _WORKER_PIPELINE._process_articles(articles)  # pylint: disable=protected-access
+    except Exception:  # pylint: disable=broad-except
+        # statistics of the failed batch are collected again article by article
+        _WORKER_PIPELINE.observers = [observer.empty() for observer in _WORKER_PIPELINE.observers]
+        for article in articles:
+            try:
+                raw_hashes.update(
+                    _WORKER_PIPELINE._process_articles([article]))  # pylint: disable=protected-access
+            except Exception as error:  # pylint: disable=broad-except
+                errors[article.article_id] = f'{type(error).__name__}: {error}'
+
+    observers = _WORKER_PIPELINE.observers
+    _WORKER_PIPELINE.observers = [observer.empty() for observer in observers]
+    return errors, _WORKER_PIPELINE.analyzers.pop_statistics(), raw_hashes, observers
+
+
+def _format_ids(ids) -> str:
+    """
+    Lists ids compactly, joining consecutive ones into ranges
+    """
+    ranges = []
+    for article_id in sorted(ids):
+        if ranges and ranges[-1][1] == article_id - 1:
+            ranges[-1][1] = article_id
+        else:
+            ranges.append([article_id, article_id])
+    return ', '.join(str(first) if first == last else f'{first}-{last}' for first, last in ranges)
+
+
+def _scan_dataset_files(path_to_validate: Path):
+    """
+    Collects raw texts and ids of meta files of a dataset in one pass,
+    returns None if the dataset folder is empty
+    """
+    raw_files = {}
+    meta_ids = set()
+    issues = []
+    has_files = False
+    for file in iter_dataset_files(path_to_validate):
+        has_files = True
+        for suffix, storage in (('_raw.txt', raw_files), ('_meta.json', meta_ids)):
+            if not file.name.endswith(suffix):
+                continue
+            article_id = file.name[:-len(suffix)]
+            if not article_id.isdigit():
+                issues.append(f'unexpected file name: {file.name}')
+            elif storage is raw_files:
+                raw_files[int(article_id)] = file
+            else:
+                meta_ids.add(int(article_id))
+    if not has_files:
+        return None
+    return raw_files, meta_ids, issues
+
+
+def _get_empty_ids(raw_files: dict, workers: int) -> set:
+    """
+    Returns ids of raw texts of zero size, sizes are requested by a pool of threads if needed
+    """
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sizes = list(executor.map(lambda file: file.stat().st_size, raw_files.values(),
+                                      chunksize=1000))
+    else:
+        sizes = [file.stat().st_size for file in raw_files.values()]
+    return {article_id for article_id, size in zip(raw_files, sizes) if not size}
+
+
+def validate_dataset(path_to_validate, workers: int = 1):
+    """
+    Validates folder with assets in a single pass over its files without reading them.
+    Reports every inconsistency found at once
     """
     if isinstance(path_to_validate, str):
         path_to_validate = Path(path_to_validate)
@@ -163,42 +901,62 @@ def validate_dataset(path_to_validate):
     if not path_to_validate.is_dir():
         raise NotADirectoryError
 
-    if not any(path_to_validate.iterdir()):
+    dataset_files = _scan_dataset_files(path_to_validate)
+    if dataset_files is None:
         raise EmptyDirectoryError
+    raw_files, meta_ids, issues = dataset_files
 
-    files = list(path_to_validate.glob('*'))
-    if not files:
-        raise EmptyDirectoryError
-
-    json_counter = 0
-    raw_counter = 0
+    invalid_ids = {article_id for article_id in set(raw_files) | meta_ids if article_id < 1}
+    if invalid_ids:
+        issues.append(f'numeration must start from 1, found ids: {_format_ids(invalid_ids)}')
 
-    for file in sorted(path_to_validate.glob('*'), key=lambda x: int(x.name[:x.name.find('_')])):
-        if file.name.endswith('raw.txt'):
-            raw_counter += 1
+    missing_ids = set(range(1, max(raw_files, default=0) + 1)).difference(raw_files)
+    if missing_ids:
+        issues.append(f'raw texts are missing for ids: {_format_ids(missing_ids)}')
 
-            if f'{raw_counter}_raw' not in file.name:
-                raise InconsistentDatasetError
+    empty_ids = _get_empty_ids(raw_files, workers)
+    if empty_ids:
+        issues.append(f'raw texts are empty for ids: {_format_ids(empty_ids)}')
 
-            with open(file, 'r', encoding='utf-8') as this_file:
-                text = this_file.read()
-            if not text:
-                raise InconsistentDatasetError
+    if meta_ids != set(raw_files):
+        mismatches = [f'{len(raw_files)} raw texts and {len(meta_ids)} meta files do not match']
+        if set(raw_files) - meta_ids:
+            mismatches.append(f'meta files are missing for ids: '
+                              f'{_format_ids(set(raw_files) - meta_ids)}')
+        if meta_ids - set(raw_files):
+            mismatches.append(f'raw texts are missing for ids: '
+                              f'{_format_ids(meta_ids - set(raw_files))}')
+        issues.append(', '.join(mismatches))
 
-        if file.name.endswith('meta.json'):
-            json_counter += 1
-
-    if json_counter != raw_counter:
-        raise InconsistentDatasetError
-    pass
+    if issues:
+        raise InconsistentDatasetError('; '.join(issues))
 
 
 def main():
     # YOUR CODE HERE
-    validate_dataset(ASSETS_PATH)
+    argument_parser = argparse.ArgumentParser(description='Processes collected articles')
+    argument_parser.add_argument('--morphology-cache', action='store_true',
+                                 help='take analyses of texts of known words from earlier runs, '
+                                      'an approximation of Mystem that may differ from its output')
+    arguments = argument_parser.parse_args()
+
+    validate_dataset(ASSETS_PATH, workers=os.cpu_count())
     corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH)
-    pipeline = TextProcessingPipeline(corpus_manager=corpus_manager)
-    pipeline.run()
+    morphology_cache_path = MORPHOLOGY_CACHE_PATH if arguments.morphology_cache else None
+    with TextProcessingPipeline(corpus_manager=corpus_manager, batch_size=10,
+                                workers=os.cpu_count(),
+                                morphology_cache_path=morphology_cache_path,
+                                manifest_path=PIPELINE_MANIFEST_PATH) as pipeline:
+        pipeline.run()
+    summary = pipeline.get_summary()
+    print(f"Analyzers startup: {summary['startup_time']:.2f} s, "
+          f"analysis: {summary['analysis_time']:.2f} s, "
+          f"parse cache hits: {summary['cache_hits']}, misses: {summary['cache_misses']}")
+    print(f"Persistent cache: {summary['persistent_cache_size']} word forms on start, "
+          f"{summary['persistent_cache_articles']} articles taken from it")
+    print(f"Up-to-date articles skipped: {summary['skipped_articles']}")
+    for article_id, error in pipeline.errors.items():
+        print(f'Article {article_id} is not processed: {error}')
 
 
 if __name__ == "__main__":
@@ -1,9 +1,22 @@
 """
 Implementation of POSFrequencyPipeline for score ten only.
 """
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
 
+from constants import ASSETS_PATH
+from core_utils.article import ArtifactType
+from core_utils.visualizer import visualize
 from pipeline import CorpusManager
 
+# part of speech opens Mystem tags of every lemma<tags> token
+POS_PATTERN = re.compile(r'<([A-Z]+)')
+READ_BUFFER_SIZE = 2 ** 20
+
 
 class EmptyFileError(Exception):
     """
@@ -11,17 +24,76 @@ class EmptyFileError(Exception):
     """
 
 
+def count_pos_frequencies(single_tagged_path: Path) -> Counter:
+    """
+    Counts Mystem parts of speech in a single-tagged file,
+    reading it in blocks that are cut at token boundaries
+    """
+    frequencies = Counter()
+    is_empty = True
+    tail = ''
+    with open(single_tagged_path, encoding='utf-8') as file:
+        for block in iter(partial(file.read, READ_BUFFER_SIZE), ''):
+            is_empty = False
+            head, _, tail = (tail + block).rpartition(' ')
+            frequencies.update(POS_PATTERN.findall(head))
+    if is_empty:
+        raise EmptyFileError(f'File {single_tagged_path} is empty')
+    frequencies.update(POS_PATTERN.findall(tail))
+    return frequencies
+
+
+def _process_article(paths: tuple) -> dict:
+    """
+    Counts parts of speech of an article and draws them,
+    returns the frequencies to be saved in the article meta
+    """
+    single_tagged_path, image_path = paths
+    frequencies = dict(count_pos_frequencies(single_tagged_path).most_common())
+    visualize(statistics=frequencies, path_to_save=image_path)
+    return frequencies
+
+
 class POSFrequencyPipeline:
-    def __init__(self, corpus_manager: CorpusManager):
-        pass
+    """
+    Counts parts of speech in already tagged articles
+    """
+
+    def __init__(self, corpus_manager: CorpusManager, *, workers: int = 1):
+        self.corpus_manager = corpus_manager
+        self.workers = workers
 
     def run(self):
-        pass
+        """
+        Saves POS frequencies of every article to its meta file and draws them
+        """
+        articles = [self.corpus_manager.get_articles()[article_id]
+                    for article_id in sorted(self.corpus_manager.get_articles())]
+        paths = [(article.get_file_path(ArtifactType.single_tagged), article.get_image_path())
+                 for article in articles]
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                frequencies = executor.map(_process_article, paths,
+                                           chunksize=max(1, len(paths) // (4 * self.workers)))
+                self._save(articles, frequencies)
+        else:
+            self._save(articles, map(_process_article, paths))
+
+    @staticmethod
+    def _save(articles: list, frequencies):
+        """
+        Stores frequencies of each article in its meta file
+        """
+        for article, article_frequencies in zip(articles, frequencies):
+            article.pos_frequencies = article_frequencies
+            article.save_meta()
 
 
 def main():
     # YOUR CODE HERE
-    pass
+    corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH)
+    POSFrequencyPipeline(corpus_manager, workers=os.cpu_count()).run()
 
 
 if __name__ == "__main__":
@@ -2,17 +2,35 @@
 Scrapper implementations
 """
 
-import random
+import argparse
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import datetime
+import hashlib
+import math
+import os
 import json
 import shutil
-from time import sleep
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit, urlunsplit
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
-from constants import CRAWLER_CONFIG_PATH, ASSETS_PATH, HEADERS, HTTP_PATTERN
+from constants import (CRAWLER_CONFIG_PATH, ASSETS_PATH, CRAWL_CHECKPOINT_PATH, HTTP_CACHE_PATH,
+                       HTTP_PATTERN, LISTING_URL_PATTERN, MAX_ARTICLES, MAX_LISTING_PAGES)
 from core_utils.article import Article
+from core_utils.dataset_index import DatasetIndex
+from core_utils.http_cache import HTTPResponseCache
+from core_utils.http_client import HTTPClient, get_default_client
+
+
+ARTICLE_PARTS_XPATH = etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " _25BQZ ")]'
+    ' | //time[@datetime]'
+    ' | //a[@data-test="archive-record-header"]')
 
 
 class IncorrectURLError(Exception):
@@ -33,14 +51,175 @@ class IncorrectNumberOfArticlesError(Exception):
     """
 
 
+class BloomFilter:
+    """
+    Memory-efficient probabilistic set of strings:
+    never misses an added string, rarely reports an absent one as present
+    """
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.number_of_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, item: str):
+        return all(self._bits[position // 8] & (1 << position % 8)
+                   for position in self._get_positions(item))
+
+    def add(self, item: str):
+        """
+        Adds a string to the set
+        """
+        for position in self._get_positions(item):
+            self._bits[position // 8] |= 1 << position % 8
+
+    def _get_positions(self, item: str):
+        """
+        Returns bit positions of a string derived from two halves of its hash
+        """
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+        return [(first + index * second) % self.size for index in range(self.number_of_hashes)]
+
+
+class CrawlFrontier:
+    """
+    Insertion-ordered set of normalized article URLs that stops growing at max_size
+    """
+    def __init__(self, max_size: int, use_bloom_filter: bool = False,
+                 expected_urls: int = 1000000):
+        self.max_size = max_size
+        self.urls = []
+        self._seen = BloomFilter(expected_urls) if use_bloom_filter else set()
+
+    def __len__(self):
+        return len(self.urls)
+
+    def __contains__(self, url: str):
+        return self.normalize(url) in self._seen
+
+    @property
+    def is_full(self):
+        """
+        Tells whether the frontier holds max_size URLs
+        """
+        return len(self.urls) >= self.max_size
+
+    @staticmethod
+    def normalize(url: str):
+        """
+        Drops query parameters and fragment, lowercases scheme and host
+        and ends the path with a slash
+        """
+        parts = urlsplit(url.strip())
+        path = parts.path or '/'
+        if not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+            path += '/'
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+    def add(self, url: str):
+        """
+        Adds a URL unless it was seen before or the frontier is full,
+        tells whether the URL was added
+        """
+        url = self.normalize(url)
+        if self.is_full or url in self._seen:
+            return False
+        self._seen.add(url)
+        self.urls.append(url)
+        return True
+
+
+class CrawlCheckpoint:
+    """
+    Persists crawl progress: found URLs, their article ids and ids of saved articles
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.urls = []
+        self.article_ids = {}
+        self.completed = set()
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as file:
+                state = json.load(file)
+            self.urls = state['urls']
+            self.article_ids = state['article_ids']
+            self.completed = set(state['completed'])
+
+    def get_article_id(self, url: str):
+        """
+        Returns an id of an article with a given URL, new URLs get the next free id
+        """
+        if url not in self.article_ids:
+            self.article_ids[url] = len(self.article_ids) + 1
+        return self.article_ids[url]
+
+    def mark_completed(self, article_id: int):
+        """
+        Records a saved article and writes the checkpoint to disk
+        """
+        self.completed.add(article_id)
+        self.save()
+
+    def save(self):
+        """
+        Writes the checkpoint to disk
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_suffix('.tmp')
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({'urls': self.urls,
+                       'article_ids': self.article_ids,
+                       'completed': sorted(self.completed)}, file, indent=4)
+        temporary_path.replace(self.path)
+
+    def clear(self):
+        """
+        Forgets all progress and removes the checkpoint file
+        """
+        self.urls = []
+        self.article_ids = {}
+        self.completed = set()
+        if self.path.exists():
+            self.path.unlink()
+
+
+def _get_client(client: HTTPClient, requests_per_second: float) -> HTTPClient:
+    """
+    Returns a given client paced by a given budget, without a client returns the shared one
+    or a dedicated one if a budget is given, so that the shared client keeps its own budget
+    """
+    if client is None:
+        if requests_per_second is None:
+            return get_default_client()
+        return HTTPClient(requests_per_second=requests_per_second)
+    if requests_per_second is not None:
+        client.scheduler.requests_per_second = requests_per_second
+    return client
+
+
 class Crawler:
     """
     Crawler implementation
     """
-    def __init__(self, seed_urls, max_articles: int):
+    def __init__(self, seed_urls, max_articles: int, *, concurrency: int = 1,
+                 requests_per_second: float = None, client: HTTPClient = None,
+                 use_bloom_filter: bool = False, max_pages: int = 0,
+                 listing_url: str = LISTING_URL_PATTERN):
+        # pylint: disable=too-many-arguments
         self.max_articles = max_articles
         self.seed_urls = seed_urls
-        self.urls = []
+        self.frontier = CrawlFrontier(max_articles, use_bloom_filter)
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.listing_url = listing_url
+        self.client = _get_client(client, requests_per_second)
+
+    @property
+    def urls(self):
+        """
+        Returns found article URLs in the order they were found
+        """
+        return self.frontier.urls
 
     def _extract_url(self, article_bs):
         part_urls = []
@@ -51,35 +230,96 @@ class Crawler:
         full_urls = [HTTP_PATTERN + part_url for part_url in part_urls]
 
         for full_url in full_urls:
-            if len(self.urls) < self.max_articles and full_url not in self.urls:
-                self.urls.append(full_url)
+            if self.frontier.is_full:
+                break
+            self.frontier.add(full_url)
 
         return full_urls
 
-    def find_articles(self):
+    def _get_listing_pages(self):
         """
-        Finds articles
+        Yields seed URLs and then, if pagination is on, generated listing pages
+        following the last seed page up to max_pages.
+        Tells whether each page is generated
         """
         for seed_url in self.seed_urls:
-            sleep(random.randint(1, 5))
-            response = requests.get(url=seed_url, headers=HEADERS)
-            if not response.ok:
-                continue
+            yield seed_url, False
+        page_numbers = [int(parse_qs(urlsplit(seed_url).query).get('page', ['1'])[0])
+                        for seed_url in self.seed_urls]
+        for page in range(max(page_numbers, default=0) + 1, self.max_pages + 1):
+            yield self.listing_url.format(page=page), True
 
-            soup = BeautifulSoup(response.text, 'lxml')
+    def _process_listing(self, response):
+        """
+        Adds article URLs from a listing page to the frontier and returns how many are new
+        """
+        if not response.ok:
+            return 0
+        frontier_size = len(self.frontier)
+        self._extract_url(BeautifulSoup(response.text, 'lxml'))
+        return len(self.frontier) - frontier_size
 
-            urls = self._extract_url(soup)
-            for url in urls:
-                if len(self.urls) < self.max_articles:
-                    if url not in self.urls:
-                        self.urls.append(url)
+    def find_articles(self):
+        """
+        Finds articles on listing pages until the frontier is full
+        or a generated page brings no new articles
+        """
+        if self.concurrency > 1:
+            asyncio.run(self.find_articles_async())
+            return
+
+        for page_url, generated in self._get_listing_pages():
+            if self.frontier.is_full:
+                break
+            try:
+                new_urls = self._process_listing(self.client.get(page_url))
+            except requests.RequestException:
+                new_urls = 0
+            if not new_urls and generated:
+                break
+
+    async def find_articles_async(self):
+        """
+        Fetches listing pages concurrently, keeping up to concurrency pages in flight,
+        and extracts links from each page as soon as it arrives
+        """
+        listing_pages = self._get_listing_pages()
+        in_flight = {}
+        pages_left = True
+        try:
+            while not self.frontier.is_full:
+                while pages_left and len(in_flight) < self.concurrency:
+                    page_url, generated = next(listing_pages, (None, False))
+                    if page_url is None:
+                        pages_left = False
+                        break
+                    task = asyncio.ensure_future(asyncio.to_thread(self.client.get, page_url))
+                    in_flight[task] = generated
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    generated = in_flight.pop(task)
+                    try:
+                        new_urls = self._process_listing(task.result())
+                    except requests.RequestException:
+                        new_urls = 0
+                    if not new_urls and generated:
+                        pages_left = False
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
 
 class HTMLParser:
-    def __init__(self, article_url, article_id):
+    def __init__(self, article_url, article_id, client: HTTPClient = None, *, fast: bool = True):
         self.article_url = article_url
         self.article_id = article_id
         self.article = Article(self.article_url, self.article_id)
+        self.client = client or get_default_client()
+        self.fast = fast
 
     def _fill_article_with_meta_information(self, article_bs):
         self.article.author = 'NOT FOUND'
@@ -90,14 +330,9 @@ class HTMLParser:
         except AttributeError:
             self.article.topics = 'NOT FOUND'
 
-        raw_date = str(article_bs.find('time', {'datetime': '2022-04-28T18:01:00'}))
-        date = raw_date[:9]
-        time = raw_date[11:15]
-        complete_date = ', '.join([date, time])
-        self.article.date = complete_date
-
-        all_post_list_urls_bs = article_bs.find_all('a', {"target": "_self"})
-        print(all_post_list_urls_bs)
+        time_bs = article_bs.find('time', {'datetime': True})
+        if time_bs is not None:
+            self.article.date = datetime.datetime.fromisoformat(time_bs['datetime'])
 
     def _fill_article_with_text(self, article_bs):
         self.article.text = ''
@@ -116,23 +351,198 @@ class HTMLParser:
         #     self.article.text += k.text
 
     def parse(self):
-        response = requests.get(url=self.article_url, headers=HEADERS)
+        response = self.client.get(self.article_url)
+        if self.client.cache is None:
+            return self.parse_html(response.text)
+
+        fields = self.client.cache.load_parsed(self.article_url)
+        if fields is not None:
+            return self.restore(fields)
+        self.parse_html(response.text)
+        self.client.cache.store_parsed(self.article_url, self.get_fields())
+        return self.article
 
-        article_bs = BeautifulSoup(response.text, 'lxml')
+    def parse_html(self, html):
+        """
+        Fills the article with information from an already downloaded page
+        """
+        article_bs = None
+        if self.fast:
+            article_bs = self._parse_article_parts(html)
+        if article_bs is None:
+            article_bs = BeautifulSoup(html, 'lxml')
 
         self._fill_article_with_text(article_bs)
         self._fill_article_with_meta_information(article_bs)
         return self.article
 
+    @staticmethod
+    def _parse_article_parts(html):
+        """
+        Builds a small tree of text blocks, dates and topic links only
+        or returns None if lxml cannot read the page
+        """
+        try:
+            tree = lxml_html.document_fromstring(html)
+        except (ValueError, etree.ParserError):
+            return None
+        parts = ARTICLE_PARTS_XPATH(tree)
+        selected = set(parts)
+        outermost_parts = [part for part in parts
+                           if not any(ancestor in selected for ancestor in part.iterancestors())]
+        return BeautifulSoup(''.join(lxml_html.tostring(part, encoding='unicode', with_tail=False)
+                                     for part in outermost_parts), 'lxml')
+
+    def get_fields(self):
+        """
+        Returns parsed fields of the article in a form that can be stored in JSON
+        """
+        return {
+            'title': self.article.title,
+            'date': self.article.date.isoformat() if self.article.date else None,
+            'author': self.article.author,
+            'topics': self.article.topics,
+            'text': self.article.text
+        }
+
+    def restore(self, fields):
+        """
+        Fills the article with previously parsed fields
+        """
+        self.article.title = fields['title']
+        self.article.date = datetime.datetime.fromisoformat(fields['date']) if fields['date'] else None
+        self.article.author = fields['author']
+        self.article.topics = fields['topics']
+        self.article.text = fields['text']
+        return self.article
+
+
+def _parse_article(article_url, article_id, html):
+    """
+    Parses a downloaded page in a worker process
+    """
+    parser = HTMLParser(article_url, article_id)
+    parser.parse_html(html)
+    return parser.get_fields()
 
-def prepare_environment(base_path):
+
+class ArticleCollector:
     """
-    Creates ASSETS_PATH folder if not created and removes existing folder
+    Downloads, parses and saves articles concurrently: a pool of threads fetches pages,
+    a pool of processes parses them and the calling thread saves parsed articles
+    """
+    def __init__(self, fetch_workers: int = 4, parse_workers: int = None,
+                 requests_per_second: float = None, max_pending: int = 16, *,
+                 client: HTTPClient = None):
+        # pylint: disable=too-many-arguments
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.max_pending = max_pending
+        self.client = _get_client(client, requests_per_second)
+
+    def collect(self, urls, checkpoint: CrawlCheckpoint = None):
+        """
+        Collects articles from given URLs, ids follow the order of URLs
+        whatever order pages arrive in.
+        With a checkpoint, ids are taken from it, already saved articles are skipped
+        and every saved article is recorded, the checkpoint is cleared once
+        all articles are collected.
+        Returns errors for articles that could not be collected by their ids
+        """
+        queued = iter(self._get_pending(urls, checkpoint))
+        in_flight = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetchers, \
+                ProcessPoolExecutor(max_workers=self.parse_workers) as parsers:
+            while True:
+                while len(in_flight) < self.max_pending:
+                    pending = next(queued, None)
+                    if pending is None:
+                        break
+                    in_flight[fetchers.submit(self._fetch, pending[1])] = (*pending, 'fetch')
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    try:
+                        parsing = self._complete(future, task, parsers, checkpoint)
+                    except Exception as error:  # pylint: disable=broad-except
+                        errors[task[0]] = f'{type(error).__name__}: {error}'
+                        continue
+                    if parsing is not None:
+                        in_flight[parsing] = (*task[:2], 'parse')
+        if checkpoint is not None and not errors:
+            checkpoint.clear()
+        return dict(sorted(errors.items()))
+
+    def _complete(self, future, task, parsers, checkpoint):
+        """
+        Handles a finished fetch or parse task of an article: saves the article
+        if it is parsed or its page is unchanged since it was parsed,
+        otherwise submits the page for parsing and returns the future of parsing
+        """
+        article_id, url, stage = task
+        if stage == 'parse':
+            self._save(article_id, url, future.result(), checkpoint)
+            return None
+        html, fields = future.result()
+        if fields is None:
+            return parsers.submit(_parse_article, url, article_id, html)
+        self._save(article_id, url, fields, checkpoint, parsed_now=False)
+        return None
+
+    def _save(self, article_id, url, fields, checkpoint, *, parsed_now=True):
+        """
+        Saves a parsed article, remembers freshly parsed fields in the response cache
+        """
+        # pylint: disable=too-many-arguments
+        if parsed_now and self.client.cache is not None:
+            self.client.cache.store_parsed(url, fields)
+        HTMLParser(url, article_id, self.client).restore(fields).save_raw()
+        if checkpoint is not None:
+            checkpoint.mark_completed(article_id)
+
+    @staticmethod
+    def _get_pending(urls, checkpoint):
+        """
+        Returns ids and URLs of articles that are not saved yet,
+        articles whose raw texts are missing from disk are collected again
+        """
+        if checkpoint is None:
+            return list(enumerate(urls, start=1))
+        pending = [(checkpoint.get_article_id(url), url) for url in urls]
+        checkpoint.completed = {article_id for article_id in checkpoint.completed
+                                if Article(url=None, article_id=article_id).get_raw_text_path().exists()}
+        checkpoint.save()
+        return [(article_id, url) for article_id, url in pending
+                if article_id not in checkpoint.completed]
+
+    def _fetch(self, url):
+        """
+        Downloads a page, returns the page and its previously parsed fields
+        if the page is unchanged
+        """
+        response = self.client.get(url)
+        response.raise_for_status()
+        fields = None
+        if self.client.cache is not None:
+            fields = self.client.cache.load_parsed(url)
+        return response.text, fields
+
+
+def prepare_environment(base_path, fresh: bool = True):
+    """
+    Creates ASSETS_PATH folder if not created,
+    removes existing folder unless an interrupted crawl is resumed
     """
     path_for_environment = Path(base_path)
-    if path_for_environment.exists():
+    if fresh and path_for_environment.exists():
         shutil.rmtree(base_path)
-    path_for_environment.mkdir(parents=True)
+    if not path_for_environment.exists():
+        path_for_environment.mkdir(parents=True)
+        DatasetIndex(path_for_environment).reset()
 
 
 def validate_config(crawler_path):
@@ -152,25 +562,50 @@ def validate_config(crawler_path):
 
     seed_urls = configuration["seed_urls"]
     total_articles_to_find_and_parse = configuration["total_articles_to_find_and_parse"]
+    max_articles = configuration.get("max_articles", MAX_ARTICLES)
 
-    if not isinstance(total_articles_to_find_and_parse, int):
-        raise IncorrectNumberOfArticlesError
-    if total_articles_to_find_and_parse <= 0:
-        raise IncorrectNumberOfArticlesError
+    for number_of_articles in (total_articles_to_find_and_parse, max_articles):
+        if not isinstance(number_of_articles, int):
+            raise IncorrectNumberOfArticlesError
+        if number_of_articles <= 0:
+            raise IncorrectNumberOfArticlesError
 
-    if total_articles_to_find_and_parse > 200:
+    if total_articles_to_find_and_parse > max_articles:
         raise NumberOfArticlesOutOfRangeError
 
     return seed_urls, total_articles_to_find_and_parse
 
 
 if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description='Collects articles from nn.ru')
+    argument_parser.add_argument('--fresh', action='store_true',
+                                 help='discard a checkpoint of an interrupted crawl and start over')
+    argument_parser.add_argument('--offline', action='store_true',
+                                 help='serve every page from the response cache without network')
+    arguments = argument_parser.parse_args()
+
     seed_links, mx_articles = validate_config(CRAWLER_CONFIG_PATH)
-    prepare_environment(ASSETS_PATH)
-    crawler = Crawler(seed_urls=seed_links, max_articles=mx_articles)
+    crawl_checkpoint = CrawlCheckpoint(CRAWL_CHECKPOINT_PATH)
+    if arguments.fresh:
+        crawl_checkpoint.clear()
+    prepare_environment(ASSETS_PATH, fresh=not crawl_checkpoint.path.exists())
+
+    http_client = HTTPClient(requests_per_second=1.0, cache=HTTPResponseCache(HTTP_CACHE_PATH),
+                             offline=arguments.offline)
+    crawler = Crawler(seed_urls=seed_links, max_articles=mx_articles,
+                      concurrency=5, client=http_client, max_pages=MAX_LISTING_PAGES)
+    for checkpoint_url in crawl_checkpoint.urls:
+        crawler.frontier.add(checkpoint_url)
     crawler.find_articles()
-
-    for index, a_text in enumerate(crawler.urls):
-        parser = HTMLParser(a_text, index + 1)
-        article = parser.parse()
-        article.save_raw()
+    crawl_checkpoint.urls = list(crawler.urls)
+    crawl_checkpoint.save()
+
+    collector = ArticleCollector(fetch_workers=4, parse_workers=os.cpu_count(), client=http_client)
+    collection_errors = collector.collect(crawler.urls, crawl_checkpoint)
+    for failed_id, collection_error in collection_errors.items():
+        print(f'Article {failed_id} is not collected: {collection_error}')
+
+    statistics = http_client.get_statistics()
+    print(f"Requests: {statistics['requests']}, from cache: {statistics['cache_hits']}, "
+          f"mean time: {statistics['mean_time']:.2f} s, longest: {statistics['max_time']:.2f} s, "
+          f"waiting for politeness: {statistics['waiting_time']:.2f} s")